@@ -27,54 +27,88 @@ Usage:
 
 import argparse
 import asyncio
+import functools
+import logging
 import os
 import sys
-import warnings
 from pathlib import Path
 
-# Suppress ADK experimental feature warnings
-warnings.filterwarnings("ignore", message=".*EXPERIMENTAL.*")
-warnings.filterwarnings("ignore", message=".*non-text parts.*")
+# Project paths resolved once; later exists()/read calls hit the OS path
+# cache regardless of cwd changes
+_ROOT = Path(__file__).resolve().parent.parent
+_ENV_FILE = _ROOT / ".env"
 
-# Configure LiteLLM to drop unsupported parameters for Bedrock
-import litellm
-litellm.drop_params = True
+# Add src to path for development (required before skill_framework imports)
+sys.path.insert(0, str(_ROOT / "src"))
 
-# Add src to path for development
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from skill_framework.agent import AgentBuilder
+from skill_framework.integration.adk_adapter import ADKAdapter
 
-# Load .env file
-from dotenv import load_dotenv
-load_dotenv(Path(__file__).parent.parent / ".env")
+logger = logging.getLogger(__name__)
 
-# Setup observability (logging and OTEL)
-from skill_framework.observability.logging_config import setup_logging
-from skill_framework.observability.telemetry import setup_telemetry
 
-# Configure logging
-log_level = os.getenv("LOG_LEVEL", "INFO")
-log_format = os.getenv("LOG_FORMAT", "json")
-setup_logging(level=log_level, format_type=log_format)
+def _bootstrap() -> None:
+    """Run side-effectful startup (dotenv, logging, telemetry).
 
-# Configure Phoenix telemetry (auto-instrumentation)
-phoenix_endpoint = os.getenv("PHOENIX_COLLECTOR_ENDPOINT", "http://localhost:6006")
-tracer_provider = setup_telemetry(
-    project_name="skill_framework_agent",
-    auto_instrument=True,
-)
+    Kept out of module scope so importing examples.basic_agent (e.g. from
+    a test) stays cheap and doesn't spawn OTLP exporter threads or probe
+    the Phoenix collector.
+    """
+    # ADK warning filters are installed once by the skill_framework package
+
+    # Load .env file
+    from dotenv import load_dotenv
+    load_dotenv(_ENV_FILE)
+
+    # Setup observability (logging and OTEL)
+    from skill_framework.observability.logging_config import setup_logging
+    from skill_framework.observability.telemetry import setup_telemetry
+
+    # Configure logging
+    log_level = os.getenv("LOG_LEVEL", "INFO")
+    log_format = os.getenv("LOG_FORMAT", "json")
+    setup_logging(level=log_level, format_type=log_format)
+
+    # Configure Phoenix telemetry (auto-instrumentation)
+    phoenix_endpoint = os.getenv("PHOENIX_COLLECTOR_ENDPOINT", "http://localhost:6006")
+    tracer_provider = setup_telemetry(
+        project_name="skill_framework_agent",
+        auto_instrument=True,
+    )
 
-import logging
-logger = logging.getLogger(__name__)
+    if tracer_provider:
+        logger.info("✓ Phoenix telemetry enabled: endpoint=%s", phoenix_endpoint)
+    else:
+        logger.warning("⚠ Phoenix telemetry not available (install: pip install openinference-instrumentation-google-adk arize-phoenix-otel)")
 
-if tracer_provider:
-    logger.info(f"✓ Phoenix telemetry enabled: endpoint={phoenix_endpoint}")
-else:
-    logger.warning("⚠ Phoenix telemetry not available (install: pip install openinference-instrumentation-google-adk arize-phoenix-otel)")
+    logger.info("Observability configured: log_level=%s", log_level)
 
-logger.info(f"Observability configured: log_level={log_level}")
 
-from skill_framework.agent import AgentBuilder
-from skill_framework.integration.adk_adapter import ADKAdapter
+@functools.lru_cache(maxsize=1)
+def _litellm_cls():
+    """Import the LiteLlm wrapper class once (pulls in the LiteLLM tree).
+
+    Kept lazy so the native Gemini path never pays the LiteLLM/boto3
+    import cost at all.
+    """
+    import litellm
+
+    # Configure LiteLLM to drop unsupported parameters for Bedrock
+    litellm.drop_params = True
+
+    from google.adk.models.lite_llm import LiteLlm
+
+    return LiteLlm
+
+
+@functools.lru_cache(maxsize=32)
+def _litellm_model(model_str: str):
+    """Return a cached LiteLlm wrapper for the given model string.
+
+    Constructing multiple agents in one process (tests, evals) reuses the
+    same wrapper instead of re-initializing the LiteLLM provider registry.
+    """
+    return _litellm_cls()(model=model_str)
 
 
 def create_model(provider: str, model_name: str | None = None):
@@ -93,72 +127,141 @@ def create_model(provider: str, model_name: str | None = None):
         return model_name or "gemini-2.0-flash"
 
     elif provider == "openai":
-        from google.adk.models.lite_llm import LiteLlm
         model = model_name or "gpt-4o"
-        return LiteLlm(model=f"openai/{model}")
+        return _litellm_model(f"openai/{model}")
 
     elif provider == "anthropic":
-        from google.adk.models.lite_llm import LiteLlm
         model = model_name or "claude-3-5-sonnet-20241022"
-        return LiteLlm(model=f"anthropic/{model}")
+        return _litellm_model(f"anthropic/{model}")
 
     elif provider == "bedrock":
-        from google.adk.models.lite_llm import LiteLlm
         # Get model ID - prefer MODEL_ID, then MODEL_NAME, then default
         model_id = model_name or os.getenv("MODEL_ID") or os.getenv("MODEL_NAME", "anthropic.claude-3-5-sonnet-20241022-v2:0")
-        
+
         # Strip any existing bedrock/ prefix
         model_id = model_id.replace("bedrock/", "")
-        
+
         # If it's an ARN or inference profile, use converse route
         if "arn:aws:bedrock" in model_id or "inference-profile" in model_id:
             model_str = f"bedrock/converse/{model_id}"
         else:
             model_str = f"bedrock/{model_id}"
-        
-        logger.info(f"Using model: {model_str}")
-        return LiteLlm(model=model_str)
+
+        logger.info("Using model: %s", model_str)
+        return _litellm_model(model_str)
 
     elif provider == "azure":
-        from google.adk.models.lite_llm import LiteLlm
         if not model_name:
             raise ValueError("Azure requires --model to specify deployment name")
-        return LiteLlm(model=f"azure/{model_name}")
+        return _litellm_model(f"azure/{model_name}")
 
     else:
         raise ValueError(f"Unknown provider: {provider}")
 
 
-async def run_agent(provider: str, model_name: str | None = None) -> None:
+async def run_batch(
+    builder: AgentBuilder,
+    model,
+    instruction: str,
+    batch_file: Path,
+    max_concurrency: int = 10,
+) -> None:
+    """Run prompts from a file concurrently instead of one-at-a-time.
+
+    Each prompt still pays full model latency, but dispatching them with
+    asyncio.gather overlaps the round trips. A semaphore bounds in-flight
+    requests to stay under provider rate limits.
+
+    Prompts are independent, and neither the agent nor the adapter is
+    reentrant - ADKAdapter holds one agent/runner that create_agent
+    replaces, so sharing an adapter would let a concurrent producer swap
+    the runner out from under another prompt's session. Every prompt
+    therefore gets its own adapter, agent, and session; the model wrapper
+    itself is safely shared (and cached by _litellm_model).
+    """
+    prompts = [line for line in batch_file.read_text().splitlines() if line.strip()]
+    logger.info("Batch mode: %d prompts from %s", len(prompts), batch_file)
+
+    sem = asyncio.Semaphore(max_concurrency)
+    queue: asyncio.Queue[tuple[int, str]] = asyncio.Queue()
+
+    async def produce(index: int, prompt: str) -> None:
+        # A failed call must still feed the queue, or the drain loop
+        # below waits forever on its result
+        try:
+            async with sem:
+                agent = builder.create_agent(
+                    adapter=ADKAdapter(model=model, app_name="skill_demo"),
+                    name="skill_agent",
+                    instruction=instruction,
+                )
+                response = await agent.chat(prompt)
+        except Exception as e:
+            logger.error("Prompt %d failed: %s", index, e)
+            response = f"Error: {e}"
+        await queue.put((index, response))
+
+    producers = [
+        asyncio.create_task(produce(i, p)) for i, p in enumerate(prompts)
+    ]
+
+    # Single consumer drains the queue and emits results in input order as
+    # they become available, so stdout stays ordered without serializing
+    # the LLM calls themselves
+    pending: dict[int, str] = {}
+    next_expected = 0
+    for _ in prompts:
+        index, response = await queue.get()
+        pending[index] = response
+        while next_expected in pending:
+            sys.stdout.write(
+                f"\nYou: {prompts[next_expected]}"
+                f"\nAgent: {pending.pop(next_expected)}\n"
+            )
+            sys.stdout.flush()
+            next_expected += 1
+
+    await asyncio.gather(*producers)
+
+
+async def run_agent(
+    provider: str,
+    model_name: str | None = None,
+    batch_file: Path | None = None,
+) -> None:
     """Run an interactive agent with skill support."""
     # Skills directory loaded from SKILLS_DIR env var or defaults to ./skills
     from skill_framework.config import Config
     skills_dir = Config.get_skills_dir()
 
     logger.info("=" * 60)
-    logger.info(f"Skill Framework Agent - {provider.upper()}")
+    logger.info("Skill Framework Agent - %s", provider.upper())
     logger.info("=" * 60)
-    logger.info(f"Skills directory: {skills_dir}")
+    logger.info("Skills directory: %s", skills_dir)
 
     # Create model based on provider
     model = create_model(provider, model_name)
-    logger.info(f"Using model: {model}")
+    logger.info("Using model: %s", model)
 
     # Create adapter and builder (skills_directory is optional, uses config)
     adapter = ADKAdapter(model=model, app_name="skill_demo")
     builder = AgentBuilder()  # Uses SKILLS_DIR from .env
+    instruction = "You are a helpful assistant with access to skills."
 
     # Create skill-enabled agent (all wiring handled automatically)
     agent = builder.create_agent(
         adapter=adapter,
         name="skill_agent",
-        instruction="You are a helpful assistant with access to skills.",
+        instruction=instruction,
     )
 
-    # Show available skills
-    logger.info("\nAvailable skills:")
-    for name, description in agent.available_skills.items():
-        logger.info(f"  - {name}: {description}")
+    # Show available skills (single log record instead of one per skill)
+    logger.info("\nAvailable skills:\n%s", agent.available_skills_listing)
+
+    # Batch mode: run prompts from file concurrently, then exit
+    if batch_file:
+        await run_batch(builder, model, instruction, batch_file)
+        return
 
     logger.info("\nType 'quit' to exit")
     logger.info("-" * 60)
@@ -166,7 +269,9 @@ async def run_agent(provider: str, model_name: str | None = None) -> None:
     # Interactive loop
     while True:
         try:
-            user_input = input("\nYou: ").strip()
+            # Read on a worker thread so the event loop (telemetry flushes,
+            # background tasks) keeps running while waiting for the user
+            user_input = (await asyncio.to_thread(input, "\nYou: ")).strip()
         except (EOFError, KeyboardInterrupt):
             logger.info("\nGoodbye!")
             break
@@ -178,33 +283,60 @@ async def run_agent(provider: str, model_name: str | None = None) -> None:
             logger.info("Goodbye!")
             break
 
-        # Send message and get response (message tracking handled automatically)
+        # Deterministic pre-pass: match input against skill keywords locally.
+        # Tool execution lives inside the ADK runner, so we can't invoke the
+        # skill tool without the model - but a confident match lets us fold
+        # the activation directive into the same round trip instead of
+        # spending an extra turn on skill discovery.
+        matched = builder.skill_meta_tool.match_skill(user_input)
+        if matched and matched not in agent.active_skills:
+            logger.debug("Skill pre-match: %s", matched)
+            user_input = (
+                f'[Activate the "{matched}" skill via the Skill tool] {user_input}'
+            )
+
+        # Stream the response so first tokens appear at first-token latency
+        # instead of waiting for the full generation
         try:
-            response = await agent.chat(user_input)
-            logger.info(f"\nAgent: {response}")
+            # Direct writes: one syscall per chunk (flush is required to
+            # surface tokens immediately), single trailing newline at end
+            sys.stdout.write("\nAgent: ")
+            sys.stdout.flush()
+            async for chunk in agent.chat_stream(user_input):
+                sys.stdout.write(chunk)
+                sys.stdout.flush()
+            sys.stdout.write("\n")
+            sys.stdout.flush()
         except Exception as e:
-            logger.error(f"\nError: {e}")
+            logger.error("\nError: %s", e)
+
+
+# Required env vars per provider (bedrock uses boto3 credentials;
+# MODEL_ID/MODEL_NAME are optional with defaults)
+_REQUIRED_VARS: dict[str, tuple[str, ...]] = {
+    "gemini": ("GOOGLE_API_KEY",),
+    "openai": ("OPENAI_API_KEY",),
+    "anthropic": ("ANTHROPIC_API_KEY",),
+    "bedrock": (),
+    "azure": ("AZURE_API_KEY", "AZURE_API_BASE"),
+}
 
 
 def check_credentials(provider: str) -> bool:
     """Check if required credentials are available for the provider."""
-    required_vars = {
-        "gemini": ["GOOGLE_API_KEY"],
-        "openai": ["OPENAI_API_KEY"],
-        "anthropic": ["ANTHROPIC_API_KEY"],
-        "bedrock": [],  # AWS credentials via boto3, MODEL_ID/MODEL_NAME optional with defaults
-        "azure": ["AZURE_API_KEY", "AZURE_API_BASE"],
-    }
-
-    missing = [var for var in required_vars.get(provider, []) if not os.environ.get(var)]
+    missing = tuple(
+        var for var in _REQUIRED_VARS.get(provider, ()) if not os.environ.get(var)
+    )
     if missing:
-        logger.error(f"Error: Missing environment variables for {provider}: {', '.join(missing)}")
+        logger.error("Error: Missing environment variables for %s: %s", provider, ", ".join(missing))
         return False
     return True
 
 
 def main() -> None:
     """Entry point."""
+    _bootstrap()
+
     parser = argparse.ArgumentParser(
         description="Run skill-enabled agent with multiple LLM providers"
     )
@@ -220,12 +352,26 @@ def main() -> None:
         default=None,
         help="Model name override (provider-specific)",
     )
+    parser.add_argument(
+        "--batch",
+        type=Path,
+        default=None,
+        help="File with one prompt per line; runs them concurrently and exits",
+    )
     args = parser.parse_args()
 
     if not check_credentials(args.provider):
         sys.exit(1)
 
-    asyncio.run(run_agent(args.provider, args.model))
+    # Prefer uvloop when installed - the libuv-backed loop is noticeably
+    # faster under concurrent LiteLLM/OTLP network traffic
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    asyncio.run(run_agent(args.provider, args.model, batch_file=args.batch))
 
 
 if __name__ == "__main__":
@@ -25,18 +25,29 @@ Then open http://localhost:8000 in your browser.
 
 import argparse
 import asyncio
+import contextvars
+import functools
+import gzip
 import json
 import logging
 import os
 import sys
+import tempfile
 import uuid
 import warnings
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
-import re
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi.responses import (
+    HTMLResponse,
+    FileResponse,
+    JSONResponse,
+    ORJSONResponse,
+    Response,
+)
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
@@ -44,16 +55,14 @@ from pydantic import BaseModel
 warnings.filterwarnings("ignore", message=".*EXPERIMENTAL.*")
 warnings.filterwarnings("ignore", message=".*non-text parts.*")
 
-# Configure LiteLLM
-import litellm
-litellm.drop_params = True
-
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-# Load environment
-from dotenv import load_dotenv
-load_dotenv(Path(__file__).parent.parent / ".env")
+# Load environment (skip the dotenv import entirely when there is no .env)
+_ENV_FILE = Path(__file__).parent.parent / ".env"
+if _ENV_FILE.exists():
+    from dotenv import load_dotenv
+    load_dotenv(_ENV_FILE)
 
 from skill_framework.agent import AgentBuilder
 from skill_framework.integration.adk_adapter import ADKAdapter
@@ -78,67 +87,336 @@ class ChatResponse(BaseModel):
     files: list[dict[str, str]] | None = None  # [{"filename": "x.pptx", "url": "/api/files/abc123", "mime_type": "..."}]
 
 
+# Serialize JSON through orjson's C encoder when available (3-5x faster
+# than stdlib json on the per-request ChatResponse path)
+try:
+    from orjson import dumps as _json_dumps
+
+    _response_class = ORJSONResponse
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _response_class = JSONResponse
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize the agent on startup, stop the chat worker on shutdown."""
+    await _startup()
+    yield
+    worker = getattr(app.state, "chat_worker", None)
+    if worker is not None:
+        worker.cancel()
+
+
 # Global state
-app = FastAPI(title="Skills Framework Chat")
+app = FastAPI(
+    title="Skills Framework Chat",
+    default_response_class=_response_class,
+    lifespan=lifespan,
+)
+
+# Static assets served via Starlette's StaticFiles (sendfile path, cached
+# stat) instead of a per-request FileResponse from the index handler
+_STATIC_DIR = Path(__file__).parent / "static"
+if _STATIC_DIR.is_dir():
+    app.mount("/static", StaticFiles(directory=_STATIC_DIR), name="static")
+
+# chat.html read once at startup; per-request stat/open/read eliminated
+_chat_html_bytes: bytes | None = None
 agent_instance = None
 builder_instance = None
 artifact_publisher: ArtifactPublisher | None = None
-tool_outputs: list[str] = []  # Store tool outputs for FILE_OUTPUT extraction
 
+# Tool outputs for FILE_OUTPUT extraction, scoped per request context so
+# concurrent chats don't interleave each other's captured output
+_tool_outputs_var: contextvars.ContextVar[list[str]] = contextvars.ContextVar(
+    "tool_outputs"
+)
+
+
+def _current_tool_outputs() -> list[str]:
+    """Return the current request's tool-output buffer, creating it if needed."""
+    try:
+        return _tool_outputs_var.get()
+    except LookupError:
+        buffer: list[str] = []
+        _tool_outputs_var.set(buffer)
+        return buffer
+
+
+# Sideband manifest: scripts append one JSON line per produced file to
+# $ADK_FILE_MANIFEST, so the server reads O(#files) bytes instead of
+# scanning all captured stdout for markers
+_manifest_var: contextvars.ContextVar[Path | None] = contextvars.ContextVar(
+    "file_manifest", default=None
+)
+
+
+def _new_manifest_path() -> Path:
+    """Per-turn manifest location handed to child processes via env var."""
+    return Path(tempfile.gettempdir()) / f"adk_manifest_{uuid.uuid4().hex}.jsonl"
+
+
+# Prefer orjson's C parser for the marker JSON fragments
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+_FILE_OUTPUT_MARKER = "FILE_OUTPUT:"
+
+
+@functools.lru_cache(maxsize=256)
+def _path_exists(path_str: str) -> bool:
+    """Memoized exists() check, cleared per request.
+
+    Skills often re-announce the same artifact across steps; this saves a
+    stat() syscall per duplicate path within one chat turn.
+    """
+    return Path(path_str).exists()
+
+
+def _iter_file_markers(tool_output: str):
+    """Yield (path, filename, mime_type) from FILE_OUTPUT markers.
+
+    Substring scan + json parse of the {...} after each marker: linear in
+    the output size, and robust to key reordering or escaped characters
+    that broke the previous regex.
+    """
+    idx = 0
+    while True:
+        idx = tool_output.find(_FILE_OUTPUT_MARKER, idx)
+        if idx == -1:
+            return
+        start = tool_output.find("{", idx + len(_FILE_OUTPUT_MARKER))
+        if start == -1:
+            return
+        end = tool_output.find("}", start)
+        if end == -1:
+            return
+        try:
+            info = _json_loads(tool_output[start : end + 1])
+        except ValueError:
+            idx = start + 1
+            continue
+        idx = end + 1
+        if isinstance(info, dict) and {"path", "filename", "mime_type"} <= info.keys():
+            yield info["path"], info["filename"], info["mime_type"]
+
+
+def _collect_file_markers(
+    tool_output: str,
+    collected: dict[str, tuple[Path, str, str]],
+) -> None:
+    """Collect valid FILE_OUTPUT markers into `collected`, deduped by path.
+
+    Keyed by resolved absolute path so repeated announcements of the same
+    artifact (tees, retries, combined logs) overwrite rather than append.
+    """
+    if _FILE_OUTPUT_MARKER not in tool_output:
+        return
+
+    for p, fn, mt in _iter_file_markers(tool_output):
+        if _path_exists(p):
+            path = Path(p)
+            collected[str(path.resolve())] = (path, fn, mt)
+
+
+# Interned once: every file entry reuses these exact key objects instead
+# of allocating fresh strings per response
+_FILE_KEYS = (sys.intern("filename"), sys.intern("url"), sys.intern("mime_type"))
+
+
+def _publish_files(
+    valid_paths: list[tuple[Path, str, str]],
+) -> list[dict[str, str]]:
+    """Publish the collected paths and build the response file entries."""
+    publisher = artifact_publisher or get_publisher()
 
-def extract_file_outputs_from_tool_output(tool_output: str) -> list[dict[str, str]] | None:
-    """Extract file output markers from tool output and publish artifacts."""
-    pattern = r'FILE_OUTPUT:\s*\{"path":\s*"([^"]+)",\s*"filename":\s*"([^"]+)",\s*"mime_type":\s*"([^"]+)"\}'
-    matches = re.findall(pattern, tool_output)
-    
-    if not matches:
-        return None
-    
-    publisher = get_publisher()
-    files = []
-    valid_paths = [(Path(p), fn, mt) for p, fn, mt in matches if Path(p).exists()]
-    
-    if not valid_paths:
-        return None
-    
     if len(valid_paths) == 1:
-        path, filename, mime_type = valid_paths[0]
-        artifact = publisher.publish(path)
-        files.append({
-            "filename": artifact.filename,
-            "url": artifact.url,
-            "mime_type": artifact.mime_type,
-        })
+        artifact = publisher.publish(valid_paths[0][0])
     else:
-        paths = [p for p, _, _ in valid_paths]
-        artifact = publisher.publish_many(paths)
-        files.append({
-            "filename": artifact.filename,
-            "url": artifact.url,
-            "mime_type": artifact.mime_type,
-        })
-    
-    return files
+        artifact = publisher.publish_many([p for p, _, _ in valid_paths])
+
+    return [
+        dict(zip(_FILE_KEYS, (artifact.filename, artifact.url, artifact.mime_type)))
+    ]
+
+
+def extract_file_outputs_from_tool_output(tool_output: str) -> list[dict[str, str]] | None:
+    """Extract file output markers from one tool output and publish artifacts."""
+    collected: dict[str, tuple[Path, str, str]] = {}
+    _collect_file_markers(tool_output, collected)
+
+    if not collected:
+        return None
+
+    return _publish_files(list(collected.values()))
+
+
+def _capture_script_stdout(stdout: str) -> None:
+    """Stdout sink installed on ScriptExecutor at startup."""
+    _current_tool_outputs().append(stdout)
 
 
 def bash_tool_wrapper(original_bash_tool):
     """Wrap bash_tool to capture FILE_OUTPUT markers."""
     def wrapper(command: str, working_directory: str | None = None) -> str:
         result = original_bash_tool(command, working_directory)
-        tool_outputs.append(result)
+        _current_tool_outputs().append(result)
         return result
     return wrapper
 
 
+def _collect_manifest(
+    manifest: Path,
+    collected: dict[str, tuple[Path, str, str]],
+) -> None:
+    """Read the sideband manifest written by skill scripts, if present."""
+    try:
+        lines = manifest.read_bytes().splitlines()
+    except OSError:
+        return
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            info = _json_loads(line)
+        except ValueError:
+            continue
+        if isinstance(info, dict) and {"path", "filename", "mime_type"} <= info.keys():
+            p = info["path"]
+            if _path_exists(p):
+                path = Path(p)
+                collected[str(path.resolve())] = (path, info["filename"], info["mime_type"])
+    try:
+        manifest.unlink()
+    except OSError:
+        pass
+
+
 def extract_file_outputs() -> list[dict[str, str]] | None:
-    """Extract FILE_OUTPUT from all captured tool outputs."""
-    all_files = []
-    for output in tool_outputs:
-        files = extract_file_outputs_from_tool_output(output)
-        if files:
-            all_files.extend(files)
-    tool_outputs.clear()
-    return all_files if all_files else None
+    """Extract produced files from the manifest and captured tool outputs.
+
+    The manifest is the fast path (a few hundred bytes, no scanning); the
+    stdout marker scan remains as the backward-compatible fallback for
+    scripts that only print FILE_OUTPUT. Deduping by resolved path means
+    each artifact is published exactly once per turn.
+    """
+    collected: dict[str, tuple[Path, str, str]] = {}
+
+    manifest = _manifest_var.get()
+    if manifest is not None:
+        _collect_manifest(manifest, collected)
+
+    # Skip the loop and the clear entirely on idle chats (no tool output)
+    tool_outputs = _current_tool_outputs()
+    if tool_outputs:
+        for output in tool_outputs:
+            _collect_file_markers(output, collected)
+        tool_outputs.clear()
+    _path_exists.cache_clear()  # paths may appear/disappear between requests
+
+    if not collected:
+        return None
+
+    return _publish_files(list(collected.values()))
+
+
+# Max requests coalesced per worker wakeup. The agent is a stateful
+# session (each turn mutates shared conversation state), so turns can't be
+# fused into one litellm.batch_completion call - but draining everything
+# already queued in one pass amortizes the wakeup/reschedule cost when
+# requests arrive in bursts.
+_MAX_BATCH = 8
+
+
+async def _chat_worker(queue: asyncio.Queue) -> None:
+    """Drain chat requests against the shared agent, coalescing bursts.
+
+    Serializing model access through a single worker keeps only one
+    inference in flight (the agent and its session are not reentrant)
+    while the HTTP/WebSocket handlers stay fully concurrent.
+    """
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < _MAX_BATCH:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        for message, sink, manifest, response_q, stream in batch:
+            # Adopt the caller's tool-output buffer so capture hooks fire
+            # into the right request even though we run in the worker's
+            # context
+            _tool_outputs_var.set(sink)
+            # Child processes inherit the manifest location; safe to set
+            # globally because this worker serializes chats
+            os.environ["ADK_FILE_MANIFEST"] = str(manifest)
+            try:
+                if stream:
+                    async for delta in agent_instance.chat_stream(message):
+                        await response_q.put(delta)
+                    result: Any = _STREAM_DONE
+                else:
+                    result = await agent_instance.chat(message)
+            except Exception as e:
+                result = e
+            await response_q.put(result)
+
+
+# Sentinel marking the end of a streamed response on the response queue
+_STREAM_DONE = object()
+
+
+async def _enqueue_chat(message: str) -> str:
+    """Submit a message to the chat worker and await its full response."""
+    sink: list[str] = []
+    _tool_outputs_var.set(sink)
+    manifest = _new_manifest_path()
+    _manifest_var.set(manifest)
+    response_q: asyncio.Queue = asyncio.Queue(maxsize=1)
+    await app.state.chat_queue.put((message, sink, manifest, response_q, False))
+    result = await response_q.get()
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+async def _enqueue_chat_stream(message: str) -> AsyncIterator[str]:
+    """Submit a message to the chat worker and yield response deltas."""
+    sink: list[str] = []
+    _tool_outputs_var.set(sink)
+    manifest = _new_manifest_path()
+    _manifest_var.set(manifest)
+    response_q: asyncio.Queue = asyncio.Queue()
+    await app.state.chat_queue.put((message, sink, manifest, response_q, True))
+    while True:
+        item = await response_q.get()
+        if item is _STREAM_DONE:
+            return
+        if isinstance(item, Exception):
+            raise item
+        yield item
+
+
+@functools.lru_cache(maxsize=1)
+def _litellm_cls():
+    """Import the LiteLlm wrapper class once (pulls in the LiteLLM tree).
+
+    Kept lazy so the native Gemini path never pays the LiteLLM import
+    cost at all.
+    """
+    import litellm
+
+    # Configure LiteLLM to drop unsupported parameters for Bedrock
+    litellm.drop_params = True
+
+    from google.adk.models.lite_llm import LiteLlm
+
+    return LiteLlm
 
 
 def create_model(provider: str, model_name: str | None = None):
@@ -147,62 +425,62 @@ def create_model(provider: str, model_name: str | None = None):
         return model_name or "gemini-2.0-flash"
 
     elif provider == "openai":
-        from google.adk.models.lite_llm import LiteLlm
         model = model_name or "gpt-4o"
-        return LiteLlm(model=f"openai/{model}")
+        return _litellm_cls()(model=f"openai/{model}")
 
     elif provider == "anthropic":
-        from google.adk.models.lite_llm import LiteLlm
         model = model_name or "claude-3-5-sonnet-20241022"
-        return LiteLlm(model=f"anthropic/{model}")
+        return _litellm_cls()(model=f"anthropic/{model}")
 
     elif provider == "bedrock":
-        from google.adk.models.lite_llm import LiteLlm
         model_id = model_name or os.getenv("MODEL_ID") or os.getenv("MODEL_NAME", "anthropic.claude-3-5-sonnet-20241022-v2:0")
         model_id = model_id.replace("bedrock/", "")
-        
+
         if "arn:aws:bedrock" in model_id or "inference-profile" in model_id:
             model_str = f"bedrock/converse/{model_id}"
         else:
             model_str = f"bedrock/{model_id}"
-        
-        return LiteLlm(model=model_str)
+
+        return _litellm_cls()(model=model_str)
 
     elif provider == "azure":
-        from google.adk.models.lite_llm import LiteLlm
         if not model_name:
             raise ValueError("Azure requires model name")
-        return LiteLlm(model=f"azure/{model_name}")
+        return _litellm_cls()(model=f"azure/{model_name}")
 
     else:
         raise ValueError(f"Unknown provider: {provider}")
 
 
-@app.on_event("startup")
-async def startup_event():
+async def _startup():
     """Initialize agent on startup."""
-    global agent_instance, builder_instance, artifact_publisher
-    
-    # Initialize Phoenix telemetry FIRST (before creating any agents)
+    global agent_instance, builder_instance, artifact_publisher, _chat_html_bytes
+
+    # Cache the chat UI in memory for the lifetime of the process
+    html_file = _STATIC_DIR / "chat.html"
+    if html_file.exists():
+        _chat_html_bytes = html_file.read_bytes()
+
+    # Telemetry (hits the collector) and the artifact publisher (touches
+    # disk/S3) are independent and IO-bound: initialize them concurrently
+    # off the event loop. Telemetry still completes before any agent is
+    # created below, so instrumentation covers all of them.
     from skill_framework.observability.telemetry import setup_telemetry
-    setup_telemetry(project_name="skill_chat_server", auto_instrument=True)
+    _, artifact_publisher = await asyncio.gather(
+        asyncio.to_thread(
+            setup_telemetry,
+            project_name="skill_chat_server",
+            auto_instrument=True,
+        ),
+        asyncio.to_thread(get_publisher),
+    )
     logger.info("Phoenix telemetry initialized")
-    
-    # Initialize artifact publisher (auto-configures from env)
-    artifact_publisher = get_publisher()
-    
-    # Monkey-patch ScriptExecutor to capture tool outputs
+
+    # Capture script stdout for FILE_OUTPUT extraction via the executor's
+    # sink hook (no method wrapping, so execute() stays specializable)
     from skill_framework.core.script_executor import ScriptExecutor
-    original_execute = ScriptExecutor.execute
-    
-    def patched_execute(self, *args, **kwargs):
-        result = original_execute(self, *args, **kwargs)
-        if result.stdout:
-            tool_outputs.append(result.stdout)
-        return result
-    
-    ScriptExecutor.execute = patched_execute
-    
+    ScriptExecutor.default_on_stdout = _capture_script_stdout
+
     # Skills directory loaded from SKILLS_DIR env var or defaults to ./skills
     from skill_framework.config import Config
     skills_dir = Config.get_skills_dir()
@@ -240,18 +518,34 @@ You: *activates skill* → "Here's what the presentation contains..." ❌ NO FIL
 When appropriate, use skills to enhance your responses.""",
     )
     
+    # Single-worker inference queue: handlers enqueue, worker serializes
+    app.state.chat_queue = asyncio.Queue()
+    app.state.chat_worker = asyncio.create_task(_chat_worker(app.state.chat_queue))
+
     logger.info(f"Agent initialized with {len(agent_instance.available_skills)} skills")
 
 
 @app.get("/", response_class=HTMLResponse)
-async def get_index():
+async def get_index(request: Request):
     """Serve the chat UI."""
-    html_file = Path(__file__).parent / "static" / "chat.html"
-    if html_file.exists():
-        return FileResponse(html_file)
-    
-    # Fallback inline HTML if static file doesn't exist
-    return HTMLResponse(content=get_inline_html())
+    if _chat_html_bytes is not None:
+        return Response(
+            content=_chat_html_bytes,
+            media_type="text/html; charset=utf-8",
+        )
+
+    # Fallback inline HTML: constant bytes precomputed at import, served
+    # gzip-compressed when the client accepts it (~4 KB -> ~1.5 KB)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            content=_INLINE_HTML_GZIP,
+            media_type="text/html; charset=utf-8",
+            headers={"Content-Encoding": "gzip"},
+        )
+    return Response(
+        content=_INLINE_HTML_BYTES,
+        media_type="text/html; charset=utf-8",
+    )
 
 
 @app.get("/favicon.ico")
@@ -280,18 +574,29 @@ async def download_file(file_id: str):
     )
 
 
+# Skills listing is read-mostly; rebuild only when the skill set changes
+_skills_cache: tuple[int, dict] | None = None
+
+
 @app.get("/api/skills")
 async def get_skills():
     """Get available skills."""
+    global _skills_cache
     if not agent_instance:
         raise HTTPException(status_code=503, detail="Agent not initialized")
-    
-    return {
-        "skills": [
-            {"name": name, "description": desc}
-            for name, desc in agent_instance.available_skills.items()
-        ]
-    }
+
+    key = hash(tuple(agent_instance.available_skills.items()))
+    if _skills_cache is None or _skills_cache[0] != key:
+        _skills_cache = (
+            key,
+            {
+                "skills": [
+                    {"name": name, "description": desc}
+                    for name, desc in agent_instance.available_skills.items()
+                ]
+            },
+        )
+    return _skills_cache[1]
 
 
 @app.post("/api/chat", response_model=ChatResponse)
@@ -305,8 +610,7 @@ async def chat(request: ChatRequest):
     session_id = agent_instance.session_id
     
     try:
-        tool_outputs.clear()  # Clear previous outputs
-        response = await agent_instance.chat(request.message)
+        response = await _enqueue_chat(request.message)
         
         # Get active skills
         active_skills = agent_instance.active_skills
@@ -327,6 +631,11 @@ async def chat(request: ChatRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _ws_send(websocket: WebSocket, obj: dict) -> None:
+    """Send one JSON frame, serialized with orjson when available."""
+    await websocket.send_bytes(_json_dumps(obj))
+
+
 @app.websocket("/ws/chat")
 async def websocket_chat(websocket: WebSocket):
     """Handle chat via WebSocket for streaming responses."""
@@ -344,28 +653,30 @@ async def websocket_chat(websocket: WebSocket):
                 continue
             
             # Send acknowledgment
-            await websocket.send_json({
+            await _ws_send(websocket, {
                 "type": "ack",
                 "session_id": session_id,
             })
             
-            # Get response (for now, non-streaming)
+            # Stream response deltas as they arrive so the client renders
+            # at first-token latency instead of waiting for the full reply
             try:
-                response = await agent_instance.chat(user_message)
-                
-                # Get active skills
-                active_skills = agent_instance.active_skills
-                
-                # Send response
-                await websocket.send_json({
-                    "type": "response",
-                    "content": response,
+                async for delta in _enqueue_chat_stream(user_message):
+                    await _ws_send(websocket, {
+                        "type": "delta",
+                        "content": delta,
+                    })
+
+                # Terminal frame with per-turn metadata
+                await _ws_send(websocket, {
+                    "type": "done",
                     "session_id": session_id,
-                    "active_skills": active_skills,
+                    "active_skills": agent_instance.active_skills,
+                    "files": extract_file_outputs(),
                 })
-                
+
             except Exception as e:
-                await websocket.send_json({
+                await _ws_send(websocket, {
                     "type": "error",
                     "error": str(e),
                 })
@@ -577,6 +888,12 @@ def get_inline_html() -> str:
 """
 
 
+# Fallback page is a constant: encode and compress once at import instead
+# of rebuilding the ~4 KB string per request
+_INLINE_HTML_BYTES = get_inline_html().encode("utf-8")
+_INLINE_HTML_GZIP = gzip.compress(_INLINE_HTML_BYTES, compresslevel=6)
+
+
 def main():
     """Run the chat server."""
     parser = argparse.ArgumentParser(description="Skills Framework Chat Server")
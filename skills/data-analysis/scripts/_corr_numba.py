@@ -0,0 +1,46 @@
+"""Optional Numba-accelerated correlation kernel for wide numeric frames.
+
+Exposes `corr_upper`, a parallel kernel that computes only the upper
+triangle of the correlation matrix (mirrored into the lower half), or
+None when Numba is not installed.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    corr_upper = None
+else:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def corr_upper(X):  # pragma: no cover - requires numba
+        """Correlation matrix of the columns of X (n rows, k columns).
+
+        Normalizes each column once, then fills the upper triangle in
+        parallel - half the dot products of a full pairwise pass.
+        Constant columns normalize to NaN, matching pandas .corr().
+        """
+        n, k = X.shape
+        Z = np.empty((n, k))
+        for c in range(k):
+            mu = X[:, c].mean()
+            ss = 0.0
+            for r in range(n):
+                d = X[r, c] - mu
+                ss += d * d
+            s = np.sqrt(ss)
+            if s == 0.0:
+                s = np.nan
+            for r in range(n):
+                Z[r, c] = (X[r, c] - mu) / s
+
+        out = np.eye(k)
+        for i in prange(k):
+            for j in range(i + 1, k):
+                acc = 0.0
+                for r in range(n):
+                    acc += Z[r, i] * Z[r, j]
+                out[i, j] = acc
+                out[j, i] = acc
+        return out
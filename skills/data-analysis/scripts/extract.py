@@ -7,8 +7,13 @@ Usage:
 """
 
 import argparse
+import csv
+import hashlib
 import logging
+import os
+import shutil
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -26,9 +31,44 @@ except ImportError:
     logger.error("pandas is not installed. Install with: pip install pandas")
     sys.exit(1)
 
+# PyArrow is optional: its multi-threaded C++ readers parse CSV several
+# times faster than the pandas parser and use less memory
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.json as pa_json
+except ImportError:
+    pa = None
+
+
+def _parse_columns(columns: Optional[str]) -> Optional[list]:
+    """Parse the --columns argument into a list (None means all columns)."""
+    if not columns or columns == "*":
+        return None
+    return [c.strip() for c in columns.split(",")]
+
+
+def _header_columns(path: Path, sep: str) -> list:
+    """Read just the header row so column validation never parses the body."""
+    with open(path, newline="") as f:
+        return next(csv.reader(f, delimiter=sep), [])
+
 
-def load_data(file_path: str) -> pd.DataFrame:
-    """Load data from CSV or JSON file."""
+def _validate_columns(col_list: list, available: list) -> None:
+    """Raise ValueError if any requested column is missing."""
+    missing = [c for c in col_list if c not in available]
+    if missing:
+        raise ValueError(f"Columns not found: {', '.join(missing)}")
+
+
+def load_data(file_path: str, col_list: Optional[list] = None) -> pd.DataFrame:
+    """Load data from CSV or JSON file.
+
+    Prefers PyArrow's readers when installed, falling back to the pandas
+    parsers if PyArrow is missing or cannot parse the input. For CSV/TSV,
+    `col_list` is pushed into the reader so unused columns are never
+    tokenized or allocated.
+    """
     path = Path(file_path)
 
     if not path.exists():
@@ -36,15 +76,100 @@ def load_data(file_path: str) -> pd.DataFrame:
 
     suffix = path.suffix.lower()
 
-    if suffix == ".csv":
-        return pd.read_csv(file_path)
-    elif suffix == ".json":
-        return pd.read_json(file_path)
-    elif suffix == ".tsv":
-        return pd.read_csv(file_path, sep="\t")
-    else:
+    if suffix not in (".csv", ".json", ".tsv"):
         raise ValueError(f"Unsupported file format: {suffix}. Use .csv, .json, or .tsv")
 
+    sep = "\t" if suffix == ".tsv" else ","
+
+    # Validate requested columns against the header before parsing the body
+    if col_list and suffix != ".json":
+        _validate_columns(col_list, _header_columns(path, sep))
+
+    if pa is not None:
+        try:
+            if suffix == ".json":
+                table = pa_json.read_json(file_path)
+            else:
+                table = pa_csv.read_csv(
+                    file_path,
+                    read_options=pa_csv.ReadOptions(use_threads=True),
+                    parse_options=pa_csv.ParseOptions(delimiter=sep),
+                    convert_options=pa_csv.ConvertOptions(include_columns=col_list)
+                    if col_list
+                    else None,
+                )
+            # split_blocks/self_destruct avoid doubling memory during the
+            # Arrow -> pandas conversion
+            return table.to_pandas(split_blocks=True, self_destruct=True)
+        except pa.ArrowInvalid as e:
+            logger.debug(f"PyArrow could not parse {file_path} ({e}); using pandas")
+
+    if suffix == ".json":
+        return pd.read_json(file_path)
+    return pd.read_csv(file_path, sep=sep, usecols=col_list)
+
+
+# Rows per chunk when streaming with the pandas fallback reader
+_CHUNK_ROWS = 65536
+
+
+def _iter_batches(path: Path, sep: str, col_list: Optional[list] = None):
+    """Yield DataFrame batches from a CSV/TSV file.
+
+    Uses PyArrow's record-batch reader when available so memory stays
+    proportional to one batch; falls back to chunked pandas reads. The
+    column projection is pushed into the reader.
+    """
+    if pa is not None:
+        try:
+            reader = pa_csv.open_csv(
+                str(path),
+                parse_options=pa_csv.ParseOptions(delimiter=sep),
+                convert_options=pa_csv.ConvertOptions(include_columns=col_list)
+                if col_list
+                else None,
+            )
+            for batch in reader:
+                yield batch.to_pandas()
+            return
+        except pa.ArrowInvalid as e:
+            logger.debug(f"PyArrow could not stream {path} ({e}); using pandas")
+
+    yield from pd.read_csv(path, sep=sep, usecols=col_list, chunksize=_CHUNK_ROWS)
+
+
+def stream_extract(
+    input_file: str,
+    columns: Optional[str],
+    filter_expr: Optional[str],
+    output: Optional[str],
+) -> None:
+    """Stream a CSV/TSV input to CSV output batch-by-batch.
+
+    Projects and filters each batch as it is read and writes it straight
+    to the sink, so multi-GB inputs never materialize a full DataFrame.
+    """
+    path = Path(input_file)
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {input_file}")
+
+    sep = "\t" if path.suffix.lower() == ".tsv" else ","
+    col_list = _parse_columns(columns)
+    if col_list:
+        _validate_columns(col_list, _header_columns(path, sep))
+
+    sink = open(output, "w", newline="") if output else sys.stdout
+    try:
+        first = True
+        for chunk in _iter_batches(path, sep, col_list):
+            chunk = filter_columns(chunk, columns)
+            chunk = filter_rows(chunk, filter_expr)
+            chunk.to_csv(sink, index=False, header=first, lineterminator="\n")
+            first = False
+    finally:
+        if output:
+            sink.close()
+
 
 def filter_columns(df: pd.DataFrame, columns: Optional[str]) -> pd.DataFrame:
     """Filter dataframe to specific columns."""
@@ -62,16 +187,128 @@ def filter_columns(df: pd.DataFrame, columns: Optional[str]) -> pd.DataFrame:
 
 
 def filter_rows(df: pd.DataFrame, filter_expr: Optional[str]) -> pd.DataFrame:
-    """Filter dataframe rows using pandas query syntax."""
+    """Filter dataframe rows using pandas query syntax.
+
+    Tries the numexpr engine first - it fuses comparison, boolean mask,
+    and gather into vectorized loops over contiguous buffers - and falls
+    back to the python engine when numexpr is unavailable or rejects the
+    expression.
+    """
     if not filter_expr:
         return df
 
     try:
-        return df.query(filter_expr)
+        try:
+            return df.query(filter_expr, engine="numexpr")
+        except Exception:
+            return df.query(filter_expr, engine="python")
     except Exception as e:
         raise ValueError(f"Invalid filter expression: {filter_expr}\nError: {e}")
 
 
+def _effective_format(fmt: str, out_suffix: str, to_file: bool) -> str:
+    """The format the writer will actually emit.
+
+    The writer lets the output file's suffix override --format, and the
+    table format only exists on the stdout path (files get CSV), so the
+    cache key must be derived from the emitted bytes rather than the raw
+    flag.
+    """
+    if to_file:
+        if fmt == "csv" or out_suffix == ".csv":
+            return "csv"
+        if fmt == "json" or out_suffix == ".json":
+            return "json"
+        return "csv"
+    return fmt
+
+
+def _cache_file(args) -> Optional[Path]:
+    """Location of the cached result for this exact invocation.
+
+    Skills re-run identical extract commands across chat turns; the key
+    covers the input (path, mtime, size) and every output-shaping option
+    - including the format actually emitted and whether it goes to a
+    file or stdout, which write slightly different bytes - so a hit can
+    skip the read+filter entirely.
+    """
+    try:
+        st = os.stat(args.input_file)
+    except OSError:
+        return None
+    out_suffix = Path(args.output).suffix.lower() if args.output else ""
+    effective = _effective_format(args.format, out_suffix, bool(args.output))
+    mode = "file" if args.output else "stdout"
+    key = hashlib.blake2b(
+        f"{Path(args.input_file).resolve()}|{st.st_mtime_ns}|{st.st_size}|"
+        f"{args.columns}|{args.filter}|{effective}|{mode}".encode()
+    ).hexdigest()
+    cache_dir = (
+        Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+        / "adk-extract"
+    )
+    return cache_dir / f"{key}.out"
+
+
+# Cache entries expire after a week. Pruning runs when a new entry is
+# about to be written, so the directory stays bounded without any
+# background job.
+_CACHE_TTL_S = 7 * 24 * 3600
+
+
+def _prune_cache(cache_dir: Path) -> None:
+    """Drop cache entries (and stale temp files) older than the TTL."""
+    cutoff = time.time() - _CACHE_TTL_S
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+
+
+def _emit_file(path: Path, output: Optional[str]) -> None:
+    """Copy a cached result to the output file or stream it to stdout."""
+    if output:
+        shutil.copyfile(path, output)
+        logger.info(f"Saved to {output}")
+    else:
+        with open(path) as f:
+            shutil.copyfileobj(f, sys.stdout)
+
+
+def _commit_cache(
+    cache_file: Optional[Path],
+    work_tmp: Optional[Path],
+    output: Optional[str],
+) -> None:
+    """Store the freshly produced result in the cache (best effort).
+
+    When stdout was the destination the result was produced into
+    `work_tmp`; it is emitted first, outside the guarded cache install,
+    so a failed install can never swallow the result.
+    """
+    if cache_file is None:
+        return
+    if not output:
+        with open(work_tmp) as f:
+            shutil.copyfileobj(f, sys.stdout)
+    try:
+        if output:
+            shutil.copyfile(output, work_tmp)
+        os.replace(work_tmp, cache_file)
+    except OSError as e:
+        logger.debug(f"Could not write result cache: {e}")
+        try:
+            os.unlink(work_tmp)
+        except OSError:
+            pass
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Extract and filter data from CSV/JSON files",
@@ -105,11 +342,52 @@ Examples:
     args = parser.parse_args()
 
     try:
-        # Load data
-        df = load_data(args.input_file)
+        # Serve repeated identical invocations from the result cache
+        cache_file = _cache_file(args)
+        if cache_file is not None and cache_file.exists():
+            logger.info(f"Using cached result for {args.input_file}")
+            _emit_file(cache_file, args.output)
+            return 0
+
+        # When caching and writing to stdout, produce into a temp file in
+        # the cache directory; _commit_cache emits and installs it. An
+        # unusable cache dir just disables caching - it must never fail
+        # an extraction that would otherwise succeed.
+        work_tmp = None
+        dest = args.output
+        if cache_file is not None:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                _prune_cache(cache_file.parent)
+                work_tmp = cache_file.with_name(
+                    f"{cache_file.name}.{os.getpid()}.tmp"
+                )
+                if dest is None:
+                    dest = str(work_tmp)
+            except OSError as e:
+                logger.debug(f"Result cache unavailable: {e}")
+                cache_file = None
+                work_tmp = None
+
+        # Streaming fast path: CSV/TSV in, CSV out needs no full DataFrame
+        in_suffix = Path(args.input_file).suffix.lower()
+        out_suffix = Path(args.output).suffix.lower() if args.output else ""
+        if (
+            in_suffix in (".csv", ".tsv")
+            and args.format == "csv"
+            and out_suffix in ("", ".csv")
+        ):
+            stream_extract(args.input_file, args.columns, args.filter, dest)
+            if args.output:
+                logger.info(f"Saved to {args.output}")
+            _commit_cache(cache_file, work_tmp, args.output)
+            return 0
+
+        # Load data with the column projection pushed into the reader
+        df = load_data(args.input_file, _parse_columns(args.columns))
         logger.info(f"Loaded {len(df)} rows, {len(df.columns)} columns")
 
-        # Filter columns
+        # Reorder/validate columns (no-op for CSV, projects JSON inputs)
         df = filter_columns(df, args.columns)
 
         # Filter rows
@@ -118,24 +396,36 @@ Examples:
         if args.filter:
             logger.info(f"Filtered to {len(df)} rows (from {original_count})")
 
-        # Output results
-        if args.output:
-            output_path = Path(args.output)
-            if args.format == "csv" or output_path.suffix == ".csv":
-                df.to_csv(args.output, index=False)
-            elif args.format == "json" or output_path.suffix == ".json":
-                df.to_json(args.output, orient="records", indent=2)
+        # Output results into `dest`: the output file, the cache temp
+        # file, or stdout
+        sink = open(dest, "w", newline="") if dest else sys.stdout
+        try:
+            if args.output:
+                if args.format == "csv" or out_suffix == ".csv":
+                    df.to_csv(sink, index=False, lineterminator="\n")
+                elif args.format == "json" or out_suffix == ".json":
+                    df.to_json(sink, orient="records", indent=2)
+                else:
+                    df.to_csv(sink, index=False, lineterminator="\n")
             else:
-                df.to_csv(args.output, index=False)
+                # Write straight into the file object: pandas streams rows
+                # instead of materializing one giant string that print
+                # would re-encode and copy
+                if args.format == "table":
+                    sink.write(df.to_string(index=False))
+                    sink.write("\n")
+                elif args.format == "json":
+                    df.to_json(sink, orient="records", indent=2)
+                    sink.write("\n")
+                else:
+                    df.to_csv(sink, index=False, lineterminator="\n")
+        finally:
+            if dest:
+                sink.close()
+
+        if args.output:
             logger.info(f"Saved to {args.output}")
-        else:
-            # Print to stdout
-            if args.format == "table":
-                print(df.to_string(index=False))
-            elif args.format == "json":
-                print(df.to_json(orient="records", indent=2))
-            else:
-                print(df.to_csv(index=False), end="")
+        _commit_cache(cache_file, work_tmp, args.output)
 
         return 0
 
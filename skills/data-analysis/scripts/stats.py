@@ -7,6 +7,7 @@ Usage:
 """
 
 import argparse
+import io
 import logging
 import sys
 from pathlib import Path
@@ -27,9 +28,36 @@ except ImportError:
     logger.error("pandas and numpy are required. Install with: pip install pandas numpy")
     sys.exit(1)
 
+# Optional Arrow JSON reader (multithreaded, NDJSON only)
+try:
+    import pyarrow as pa
+    from pyarrow import json as pa_json
+except ImportError:
+    pa = None
+
+# Optional parallel Numba kernel for wide frames (None without numba)
+try:
+    from _corr_numba import corr_upper
+except ImportError:
+    corr_upper = None
+
+# Column count above which the Numba kernel beats the BLAS GEMM (symmetry
+# halves the work and centering is fused into the dot products)
+_NUMBA_MIN_COLS = 50
+
+
+def _infer_numeric_columns(path: Path, sep: str) -> list:
+    """Sniff which columns are numeric from the first 10k rows."""
+    head = pd.read_csv(path, sep=sep, nrows=10_000)
+    return head.select_dtypes(include=[np.number]).columns.tolist()
+
 
-def load_data(file_path: str) -> pd.DataFrame:
-    """Load data from CSV or JSON file."""
+def load_data(file_path: str, usecols: Optional[list] = None) -> pd.DataFrame:
+    """Load data from CSV or JSON file.
+
+    For CSV/TSV, `usecols` is pushed into the reader so unused columns
+    are never parsed or allocated.
+    """
     path = Path(file_path)
 
     if not path.exists():
@@ -37,85 +65,137 @@ def load_data(file_path: str) -> pd.DataFrame:
 
     suffix = path.suffix.lower()
 
-    if suffix == ".csv":
-        return pd.read_csv(file_path)
+    if suffix in (".csv", ".tsv"):
+        sep = "\t" if suffix == ".tsv" else ","
+        try:
+            # pyarrow engine tokenizes and type-infers in parallel, unlike
+            # the single-threaded default C engine
+            return pd.read_csv(file_path, sep=sep, usecols=usecols, engine="pyarrow")
+        except (ImportError, ValueError):
+            return pd.read_csv(file_path, sep=sep, usecols=usecols)
     elif suffix == ".json":
+        if pa is not None:
+            try:
+                # Arrow reads newline-delimited records in parallel; a
+                # plain JSON array fails parsing and falls through
+                return pa_json.read_json(file_path).to_pandas()
+            except pa.ArrowInvalid:
+                pass
         return pd.read_json(file_path)
-    elif suffix == ".tsv":
-        return pd.read_csv(file_path, sep="\t")
     else:
         raise ValueError(f"Unsupported file format: {suffix}")
 
 
-def calculate_statistics(
-    df: pd.DataFrame, columns: Optional[str] = None
+def _prepare(
+    df: pd.DataFrame, columns: Optional[list] = None, fp32: bool = False
 ) -> pd.DataFrame:
-    """Calculate descriptive statistics for numeric columns."""
+    """Select and validate the numeric columns once for both passes.
+
+    Statistics and correlations share the same subset, so the column
+    validation, select_dtypes scan, and optional float32 cast happen
+    here a single time instead of inside each calculation.
+    """
     if columns:
-        col_list = [c.strip() for c in columns.split(",")]
-        # Validate columns exist
-        missing = [c for c in col_list if c not in df.columns]
+        # Validate against the full frame before any data moves
+        missing = [c for c in columns if c not in df.columns]
         if missing:
             raise ValueError(f"Columns not found: {', '.join(missing)}")
-        df = df[col_list]
 
-    # Select only numeric columns
+    # Select numeric columns first: subsetting df[columns] up front
+    # would copy requested object/string columns only to discard them
+    # in the dtype filter a line later
     numeric_df = df.select_dtypes(include=[np.number])
 
+    if columns:
+        numeric_df = numeric_df[[c for c in columns if c in numeric_df.columns]]
+
     if numeric_df.empty:
         raise ValueError("No numeric columns found in the data")
 
-    # Calculate comprehensive statistics
-    stats = numeric_df.describe()
+    if fp32:
+        # Halving element width halves memory traffic through the kernels
+        numeric_df = numeric_df.astype(np.float32, copy=False)
 
-    # Add additional statistics
-    stats.loc["median"] = numeric_df.median()
-    stats.loc["mode"] = (
-        numeric_df.mode().iloc[0] if not numeric_df.mode().empty else np.nan
-    )
-    stats.loc["variance"] = numeric_df.var()
-    stats.loc["skewness"] = numeric_df.skew()
-    stats.loc["kurtosis"] = numeric_df.kurtosis()
+    return numeric_df
+
+
+def calculate_statistics(
+    numeric_df: pd.DataFrame, percentiles: bool = False
+) -> pd.DataFrame:
+    """Calculate descriptive statistics for numeric columns.
+
+    One agg() pass replaces describe() plus five follow-up reductions;
+    the sort-based 25/50/75 quantiles (the most expensive part of
+    describe) are computed only when requested.
+    """
+    stats = numeric_df.agg(
+        ["count", "mean", "std", "min", "max", "median", "var", "skew", "kurtosis"]
+    ).rename(index={"var": "variance", "skew": "skewness"})
+
+    # mode() is a full value-counts scan per column; compute it once
+    mode = numeric_df.mode()
+    stats.loc["mode"] = mode.iloc[0] if not mode.empty else np.nan
+
+    if percentiles:
+        stats = pd.concat([stats, numeric_df.quantile([0.25, 0.5, 0.75])])
 
     return stats
 
 
 def calculate_correlations(
-    df: pd.DataFrame, columns: Optional[str] = None
+    numeric_df: pd.DataFrame, fp32: bool = False
 ) -> pd.DataFrame:
     """Calculate correlation matrix for numeric columns."""
-    if columns:
-        col_list = [c.strip() for c in columns.split(",")]
-        df = df[col_list]
+    if len(numeric_df.columns) < 2:
+        raise ValueError("Need at least 2 numeric columns for correlation")
 
-    # Select only numeric columns
-    numeric_df = df.select_dtypes(include=[np.number])
+    # NaN-containing frames keep pandas' pairwise handling
+    if numeric_df.isna().any().any():
+        return numeric_df.corr()
 
-    if numeric_df.empty:
-        raise ValueError("No numeric columns found for correlation")
+    # float32 dispatches the GEMM below to sgemm: half the bytes moved
+    # and roughly double the SIMD throughput
+    dtype = np.float32 if fp32 else np.float64
+    X = numeric_df.to_numpy(dtype=dtype, copy=True)
 
-    if len(numeric_df.columns) < 2:
-        raise ValueError("Need at least 2 numeric columns for correlation")
+    # Wide frames dispatch to the parallel Numba kernel when available
+    if corr_upper is not None and X.shape[1] > _NUMBA_MIN_COLS:
+        C = corr_upper(X)
+        return pd.DataFrame(C, index=numeric_df.columns, columns=numeric_df.columns)
 
-    return numeric_df.corr()
+    # NaN-free fast path: mean-center and L2-normalize each column, then
+    # the correlation matrix is Z.T @ Z - one GEMM dispatched to
+    # multithreaded BLAS instead of pandas' single-core pairwise loop.
+    # Constant columns divide 0/0 and come out NaN, matching .corr().
+    X -= X.mean(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        X /= np.linalg.norm(X, axis=0)
+        C = X.T @ X
+    return pd.DataFrame(C, index=numeric_df.columns, columns=numeric_df.columns)
 
 
 def print_data_info(df: pd.DataFrame):
     """Print general information about the dataset."""
-    logger.info("=" * 60)
-    logger.info("DATASET INFORMATION")
-    logger.info("=" * 60)
-    logger.info(f"Rows: {len(df)}")
-    logger.info(f"Columns: {len(df.columns)}")
-    logger.info("\nColumn Types:")
-    logger.info(df.dtypes.to_string())
-    logger.info("\nMissing Values:")
-    missing = df.isnull().sum()
-    if missing.sum() > 0:
-        logger.info(missing[missing > 0].to_string())
+    # One log record instead of ~10: each logger call formats and flushes
+    # through the handler, and stderr flushes are not free
+    out = io.StringIO()
+    out.write("=" * 60 + "\n")
+    out.write("DATASET INFORMATION\n")
+    out.write("=" * 60 + "\n")
+    out.write(f"Rows: {len(df)}\n")
+    out.write(f"Columns: {len(df.columns)}\n")
+    out.write("\nColumn Types:\n")
+    out.write(df.dtypes.to_string() + "\n")
+    out.write("\nMissing Values:\n")
+    # any() on the raw boolean ndarray short-circuits at the first hit;
+    # the per-column sums are only worth computing when one exists
+    arr = df.isnull().to_numpy()
+    if arr.any():
+        col_missing = pd.Series(arr.sum(axis=0), index=df.columns)
+        out.write(col_missing[col_missing > 0].to_string() + "\n")
     else:
-        logger.info("No missing values")
-    logger.info("")
+        out.write("No missing values\n")
+    logger.info(out.getvalue())
 
 
 def main():
@@ -136,19 +216,51 @@ Examples:
     )
 
     parser.add_argument("input_file", help="Input CSV or JSON file")
-    parser.add_argument("--columns", help="Comma-separated list of columns to analyze")
+    parser.add_argument(
+        "--columns",
+        # Parsed once here; everything downstream receives the list
+        type=lambda s: [c.strip() for c in s.split(",")],
+        help="Comma-separated list of columns to analyze",
+    )
     parser.add_argument(
         "--correlations", action="store_true", help="Calculate correlation matrix"
     )
     parser.add_argument(
         "--no-info", action="store_true", help="Skip dataset information output"
     )
+    parser.add_argument(
+        "--fp32",
+        action="store_true",
+        help="Compute in float32 (2x less memory bandwidth, lower precision)",
+    )
+    parser.add_argument(
+        "--percentiles",
+        action="store_true",
+        help="Include 25/50/75 percentiles (slower: requires sorting)",
+    )
 
     args = parser.parse_args()
 
     try:
+        # Push column selection into the reader. Without --columns, the
+        # numeric sniff only applies when info output is skipped, since
+        # print_data_info reports every column.
+        usecols = None
+        path = Path(args.input_file)
+        suffix = path.suffix.lower()
+        if suffix in (".csv", ".tsv"):
+            sep = "\t" if suffix == ".tsv" else ","
+            if args.columns:
+                usecols = args.columns
+                header = pd.read_csv(path, sep=sep, nrows=0).columns
+                missing = [c for c in usecols if c not in header]
+                if missing:
+                    raise ValueError(f"Columns not found: {', '.join(missing)}")
+            elif args.no_info:
+                usecols = _infer_numeric_columns(path, sep) or None
+
         # Load data
-        df = load_data(args.input_file)
+        df = load_data(args.input_file, usecols)
 
         # Print dataset info
         if not args.no_info:
@@ -158,7 +270,8 @@ Examples:
         logger.info("=" * 60)
         logger.info("DESCRIPTIVE STATISTICS")
         logger.info("=" * 60)
-        stats = calculate_statistics(df, args.columns)
+        numeric_df = _prepare(df, args.columns, fp32=args.fp32)
+        stats = calculate_statistics(numeric_df, percentiles=args.percentiles)
         logger.info(stats.to_string())
         logger.info("")
 
@@ -167,20 +280,22 @@ Examples:
             logger.info("=" * 60)
             logger.info("CORRELATION MATRIX")
             logger.info("=" * 60)
-            corr = calculate_correlations(df, args.columns)
+            corr = calculate_correlations(numeric_df, fp32=args.fp32)
             logger.info(corr.to_string())
             logger.info("")
 
-            # Highlight strong correlations
+            # Highlight strong correlations: one vectorized pass over the
+            # upper triangle instead of O(k^2) Python-level .iloc calls
             logger.info("Strong Correlations (|r| > 0.7):")
-            strong_corr = []
-            for i in range(len(corr.columns)):
-                for j in range(i + 1, len(corr.columns)):
-                    r = corr.iloc[i, j]
-                    if abs(r) > 0.7:
-                        strong_corr.append(
-                            f"  {corr.columns[i]} <-> {corr.columns[j]}: {r:.3f}"
-                        )
+            arr = corr.to_numpy()
+            iu, ju = np.triu_indices(arr.shape[0], k=1)
+            vals = arr[iu, ju]
+            mask = np.abs(vals) > 0.7
+            cols = corr.columns.to_numpy()
+            strong_corr = [
+                f"  {cols[i]} <-> {cols[j]}: {v:.3f}"
+                for i, j, v in zip(iu[mask], ju[mask], vals[mask])
+            ]
 
             if strong_corr:
                 logger.info("\n".join(strong_corr))
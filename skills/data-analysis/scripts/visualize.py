@@ -21,6 +21,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 try:
+    import numpy as np
     import pandas as pd
     import matplotlib
 
@@ -28,7 +29,7 @@ try:
     import matplotlib.pyplot as plt
     import seaborn as sns
 except ImportError:
-    logger.error("Required packages not installed. Install with: pip install pandas matplotlib seaborn")
+    logger.error("Required packages not installed. Install with: pip install numpy pandas matplotlib seaborn")
     sys.exit(1)
 
 
@@ -37,6 +38,21 @@ sns.set_theme(style="whitegrid")
 plt.rcParams["figure.figsize"] = (10, 6)
 
 
+def _top_counts(series: pd.Series, n: int = 20) -> pd.Series:
+    """Top-n value counts via categorical codes and a bincount.
+
+    One pass over int codes replaces value_counts' hash aggregation over
+    the raw (often string) values.
+    """
+    cat = series if isinstance(series.dtype, pd.CategoricalDtype) else series.astype(
+        "category"
+    )
+    codes = cat.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(cat.cat.categories))
+    order = np.argsort(counts)[::-1][:n]
+    return pd.Series(counts[order], index=cat.cat.categories[order])
+
+
 def load_data(file_path: str) -> pd.DataFrame:
     """Load data from CSV or JSON file."""
     path = Path(file_path)
@@ -46,17 +62,30 @@ def load_data(file_path: str) -> pd.DataFrame:
 
     suffix = path.suffix.lower()
 
-    if suffix == ".csv":
-        return pd.read_csv(file_path)
+    if suffix in (".csv", ".tsv"):
+        sep = "\t" if suffix == ".tsv" else ","
+        try:
+            # pyarrow engine tokenizes and type-infers in parallel, unlike
+            # the single-threaded default C engine
+            df = pd.read_csv(file_path, sep=sep, engine="pyarrow")
+        except (ImportError, ValueError):
+            df = pd.read_csv(file_path, sep=sep)
     elif suffix == ".json":
-        return pd.read_json(file_path)
-    elif suffix == ".tsv":
-        return pd.read_csv(file_path, sep="\t")
+        df = pd.read_json(file_path)
     else:
         raise ValueError(f"Unsupported file format: {suffix}")
 
+    # Low-cardinality string columns become category dtype: grouping and
+    # counting then run on small integer codes instead of Python strings
+    if len(df) > 1000:
+        for col in df.select_dtypes(include=["object"]).columns:
+            if df[col].nunique() < len(df) * 0.01:
+                df[col] = df[col].astype("category")
+
+    return df
 
-def create_histogram(df: pd.DataFrame, x: str, output: str):
+
+def create_histogram(df: pd.DataFrame, x: str, output: str, dpi: int = 150):
     """Create histogram for a single column."""
     if x not in df.columns:
         raise ValueError(f"Column not found: {x}")
@@ -65,13 +94,25 @@ def create_histogram(df: pd.DataFrame, x: str, output: str):
 
     # Check if numeric or categorical
     if pd.api.types.is_numeric_dtype(df[x]):
-        plt.hist(df[x].dropna(), bins=30, edgecolor="black", alpha=0.7)
+        # Bin in numpy and hand matplotlib 30 bars; plt.hist would carry
+        # the full value array through its artist machinery. float32 is
+        # plenty for bin assignment and halves the bytes scanned.
+        vals = df[x].dropna().to_numpy(dtype=np.float32)
+        counts, edges = np.histogram(vals, bins=30)
+        plt.bar(
+            edges[:-1],
+            counts,
+            width=np.diff(edges),
+            align="edge",
+            edgecolor="black",
+            alpha=0.7,
+        )
         plt.xlabel(x)
         plt.ylabel("Frequency")
         plt.title(f"Distribution of {x}")
     else:
         # Categorical data - use value counts
-        counts = df[x].value_counts().head(20)  # Top 20 categories
+        counts = _top_counts(df[x])  # Top 20 categories
         plt.bar(range(len(counts)), counts.values, alpha=0.7)
         plt.xticks(range(len(counts)), counts.index, rotation=45, ha="right")
         plt.xlabel(x)
@@ -79,11 +120,11 @@ def create_histogram(df: pd.DataFrame, x: str, output: str):
         plt.title(f"Distribution of {x}")
 
     plt.tight_layout()
-    plt.savefig(output, dpi=300, bbox_inches="tight")
+    plt.savefig(output, dpi=dpi)
     logger.info(f"Saved histogram to {output}")
 
 
-def create_scatter(df: pd.DataFrame, x: str, y: str, output: str):
+def create_scatter(df: pd.DataFrame, x: str, y: str, output: str, dpi: int = 150):
     """Create scatter plot for two columns."""
     if x not in df.columns:
         raise ValueError(f"Column not found: {x}")
@@ -95,32 +136,46 @@ def create_scatter(df: pd.DataFrame, x: str, y: str, output: str):
     # Remove rows with missing values
     plot_df = df[[x, y]].dropna()
 
-    plt.scatter(plot_df[x], plot_df[y], alpha=0.6, edgecolors="black", linewidth=0.5)
+    if len(plot_df) > 50000:
+        # Per-point artists are unreadable and slow at this size; bin
+        # into hexagonal density cells instead
+        plt.hexbin(plot_df[x], plot_df[y], gridsize=80, cmap="viridis", mincnt=1)
+        plt.colorbar(label="Count")
+    else:
+        plt.scatter(
+            plot_df[x], plot_df[y], alpha=0.6, edgecolors="black", linewidth=0.5
+        )
     plt.xlabel(x)
     plt.ylabel(y)
     plt.title(f"{y} vs {x}")
 
-    # Add trend line if both are numeric
+    # Add trend line if both are numeric. Closed-form degree-1 fit: the
+    # analytic slope/intercept avoids polyfit's Vandermonde matrix and
+    # SVD-based least squares.
     if pd.api.types.is_numeric_dtype(plot_df[x]) and pd.api.types.is_numeric_dtype(
         plot_df[y]
     ):
-        z = np.polyfit(plot_df[x], plot_df[y], 1)
-        p = np.poly1d(z)
+        xv = plot_df[x].to_numpy()
+        yv = plot_df[y].to_numpy()
+        xc = xv - xv.mean()
+        yc = yv - yv.mean()
+        slope = (xc * yc).sum() / (xc * xc).sum()
+        intercept = yv.mean() - slope * xv.mean()
         plt.plot(
-            plot_df[x],
-            p(plot_df[x]),
+            xv,
+            slope * xv + intercept,
             "r--",
             alpha=0.8,
-            label=f"Trend: y={z[0]:.2f}x+{z[1]:.2f}",
+            label=f"Trend: y={slope:.2f}x+{intercept:.2f}",
         )
         plt.legend()
 
     plt.tight_layout()
-    plt.savefig(output, dpi=300, bbox_inches="tight")
+    plt.savefig(output, dpi=dpi)
     logger.info(f"Saved scatter plot to {output}")
 
 
-def create_bar(df: pd.DataFrame, x: str, y: Optional[str], output: str):
+def create_bar(df: pd.DataFrame, x: str, y: Optional[str], output: str, dpi: int = 150):
     """Create bar chart."""
     if x not in df.columns:
         raise ValueError(f"Column not found: {x}")
@@ -132,8 +187,24 @@ def create_bar(df: pd.DataFrame, x: str, y: Optional[str], output: str):
         if y not in df.columns:
             raise ValueError(f"Column not found: {y}")
 
-        # Aggregate data
-        grouped = df.groupby(x)[y].mean().sort_values(ascending=False).head(20)
+        # Aggregate data. Group means come from two bincount passes over
+        # the categorical codes - no hash-based groupby split needed.
+        sub = df[[x, y]].dropna()
+        cat = (
+            sub[x]
+            if isinstance(sub[x].dtype, pd.CategoricalDtype)
+            else sub[x].astype("category")
+        )
+        codes = cat.cat.codes.to_numpy()
+        yv = sub[y].to_numpy(dtype=np.float64)
+        n_cat = len(cat.cat.categories)
+        counts = np.bincount(codes, minlength=n_cat)
+        sums = np.bincount(codes, weights=yv, minlength=n_cat)
+        valid = counts > 0  # categories left empty by dropna
+        means = sums[valid] / counts[valid]
+        labels = cat.cat.categories[valid]
+        order = np.argsort(means)[::-1][:20]
+        grouped = pd.Series(means[order], index=labels[order])
         plt.bar(range(len(grouped)), grouped.values, alpha=0.7)
         plt.xticks(range(len(grouped)), grouped.index, rotation=45, ha="right")
         plt.xlabel(x)
@@ -141,7 +212,7 @@ def create_bar(df: pd.DataFrame, x: str, y: Optional[str], output: str):
         plt.title(f"Mean {y} by {x}")
     else:
         # Simple count bar chart
-        counts = df[x].value_counts().head(20)
+        counts = _top_counts(df[x])
         plt.bar(range(len(counts)), counts.values, alpha=0.7)
         plt.xticks(range(len(counts)), counts.index, rotation=45, ha="right")
         plt.xlabel(x)
@@ -149,11 +220,11 @@ def create_bar(df: pd.DataFrame, x: str, y: Optional[str], output: str):
         plt.title(f"Count by {x}")
 
     plt.tight_layout()
-    plt.savefig(output, dpi=300, bbox_inches="tight")
+    plt.savefig(output, dpi=dpi)
     logger.info(f"Saved bar chart to {output}")
 
 
-def create_line(df: pd.DataFrame, x: str, y: str, output: str):
+def create_line(df: pd.DataFrame, x: str, y: str, output: str, dpi: int = 150):
     """Create line chart (typically for time series)."""
     if x not in df.columns:
         raise ValueError(f"Column not found: {x}")
@@ -162,10 +233,20 @@ def create_line(df: pd.DataFrame, x: str, y: str, output: str):
 
     plt.figure(figsize=(12, 6))
 
-    # Sort by x axis
-    plot_df = df[[x, y]].dropna().sort_values(x)
-
-    plt.plot(plot_df[x], plot_df[y], marker="o", markersize=4, linewidth=2, alpha=0.7)
+    # Sort by x axis - skipped when the data is already ordered, which
+    # is the common case for time series exported from a query
+    plot_df = df[[x, y]].dropna()
+    if not plot_df[x].is_monotonic_increasing:
+        plot_df = plot_df.sort_values(x)
+
+    plt.plot(
+        plot_df[x].to_numpy(),
+        plot_df[y].to_numpy(),
+        marker="o",
+        markersize=4,
+        linewidth=2,
+        alpha=0.7,
+    )
     plt.xlabel(x)
     plt.ylabel(y)
     plt.title(f"{y} over {x}")
@@ -173,7 +254,7 @@ def create_line(df: pd.DataFrame, x: str, y: str, output: str):
     plt.grid(True, alpha=0.3)
 
     plt.tight_layout()
-    plt.savefig(output, dpi=300, bbox_inches="tight")
+    plt.savefig(output, dpi=dpi)
     print(f"Saved line chart to {output}")
 
 
@@ -215,6 +296,12 @@ Examples:
     parser.add_argument(
         "--output", default="chart.png", help="Output file path (default: chart.png)"
     )
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        default=150,
+        help="Output resolution (default: 150; use 300 for print quality)",
+    )
 
     args = parser.parse_args()
 
@@ -233,13 +320,13 @@ Examples:
 
         # Create visualization
         if args.type == "histogram":
-            create_histogram(df, args.x, args.output)
+            create_histogram(df, args.x, args.output, dpi=args.dpi)
         elif args.type == "scatter":
-            create_scatter(df, args.x, args.y, args.output)
+            create_scatter(df, args.x, args.y, args.output, dpi=args.dpi)
         elif args.type == "bar":
-            create_bar(df, args.x, args.y, args.output)
+            create_bar(df, args.x, args.y, args.output, dpi=args.dpi)
         elif args.type == "line":
-            create_line(df, args.x, args.y, args.output)
+            create_line(df, args.x, args.y, args.output, dpi=args.dpi)
 
         return 0
 
@@ -258,13 +345,4 @@ Examples:
 
 
 if __name__ == "__main__":
-    # Import numpy here to avoid issues if not installed
-    try:
-        import numpy as np
-    except ImportError:
-        print(
-            "Error: numpy is required. Install with: pip install numpy", file=sys.stderr
-        )
-        sys.exit(1)
-
     sys.exit(main())
@@ -6,19 +6,44 @@ Usage:
 """
 
 import argparse
+import contextlib
+import json
 import os
 import sys
+import zipfile
 from pathlib import Path
 
 try:
+    from lxml import etree
     from pptx import Presentation
+    from pptx.oxml.ns import qn
     from pptx.util import Inches, Pt
 except ImportError:
     print("Error: python-pptx not installed. Run: pip install python-pptx")
     sys.exit(1)
 
 
-def create_presentation(title, subtitle, slides, output_path):
+@contextlib.contextmanager
+def _stored_zip():
+    """Make python-pptx write the package with ZIP_STORED entries.
+
+    pptx hardwires ZIP_DEFLATED in its package writer. For decks that
+    are nothing but small XML parts the deflate pass dominates save
+    time, so swap the module-level constant for the duration of save().
+    """
+    try:
+        from pptx.opc import serialized as opc
+    except ImportError:  # python-pptx < 0.6.19
+        from pptx.opc import pkgwriter as opc
+    original = opc.ZIP_DEFLATED
+    opc.ZIP_DEFLATED = zipfile.ZIP_STORED
+    try:
+        yield
+    finally:
+        opc.ZIP_DEFLATED = original
+
+
+def create_presentation(title, subtitle, slides, output_path, compress=True):
     """Create a PowerPoint presentation.
     
     Args:
@@ -26,6 +51,7 @@ def create_presentation(title, subtitle, slides, output_path):
         subtitle: Presentation subtitle
         slides: List of (title, content) tuples
         output_path: Path to save the presentation
+        compress: Deflate package entries (disable for faster saves)
     """
     # Create presentation
     prs = Presentation()
@@ -52,21 +78,31 @@ def create_presentation(title, subtitle, slides, output_path):
         text_frame.clear()
         
         # Split content by newlines for bullet points
-        lines = slide_content.split('\n')
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if not line:
-                continue
-                
-            if i == 0:
-                text_frame.text = line
-            else:
-                p = text_frame.add_paragraph()
-                p.text = line
-                p.level = 0
+        lines = [line.strip() for line in slide_content.split('\n')]
+        if lines and lines[0]:
+            text_frame.text = lines[0]
+
+        # Remaining bullets are appended as raw <a:p> elements in one
+        # extend(): add_paragraph() re-parses the tree and rebuilds its
+        # proxy objects per call, which is quadratic over long content
+        bullets = [line for line in lines[1:] if line]
+        if bullets:
+            tx_body = text_frame._txBody
+            paragraphs = []
+            for line in bullets:
+                p = tx_body.makeelement(qn('a:p'), {})
+                r = etree.SubElement(p, qn('a:r'))
+                t = etree.SubElement(r, qn('a:t'))
+                t.text = line
+                paragraphs.append(p)
+            tx_body.extend(paragraphs)
 
     # Save presentation
-    prs.save(output_path)
+    if compress:
+        prs.save(output_path)
+    else:
+        with _stored_zip():
+            prs.save(output_path)
     logger.info(f"✓ Presentation created: {output_path}")
     logger.info(f"✓ Slides: {len(slides) + 1} (1 title + {len(slides)} content)")
     
@@ -83,6 +119,8 @@ def main():
                        help='Output filename')
     parser.add_argument('--output-dir', default=None,
                        help='Output directory (default: current directory)')
+    parser.add_argument('--no-compression', action='store_true',
+                       help='Store package entries uncompressed (faster save, larger file)')
     
     args = parser.parse_args()
     
@@ -105,11 +143,24 @@ def main():
     
     # Create presentation
     try:
-        create_presentation(args.title, args.subtitle, slides, str(output_path))
-        
-        # Print file output marker for chat UI
-        print(f'FILE_OUTPUT: {{"path": "{output_path.absolute()}", "filename": "{args.output}", "mime_type": "application/vnd.openxmlformats-officedocument.presentationml.presentation"}}')
-        
+        create_presentation(args.title, args.subtitle, slides, str(output_path),
+                            compress=not args.no_compression)
+
+        # Announce the produced file for the chat UI
+        info = json.dumps({
+            "path": str(output_path.absolute()),
+            "filename": args.output,
+            "mime_type": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+        })
+        manifest = os.environ.get("ADK_FILE_MANIFEST")
+        if manifest:
+            # Sideband manifest: the server reads this file directly
+            # instead of scanning stdout for markers
+            with open(manifest, "a") as f:
+                f.write(info + "\n")
+        else:
+            print(f"FILE_OUTPUT: {info}")
+
         return 0
     except Exception as e:
         logger.error(f"Error creating presentation: {e}")
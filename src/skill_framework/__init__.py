@@ -1,3 +1,27 @@
 """Skills meta-tool framework for Google ADK agents."""
 
+import warnings
+
 __version__ = "0.1.0"
+
+_warning_filters_installed = False
+
+
+def _install_warning_filters() -> None:
+    """Register ADK noise filters once at package import.
+
+    The warnings module compiles the message regex and prepends an entry to
+    its filter list on every filterwarnings() call; registering here keeps
+    the filter list short no matter how many entry points import us.
+    """
+    global _warning_filters_installed
+    if _warning_filters_installed:
+        return
+
+    # Suppress ADK experimental feature warnings
+    warnings.filterwarnings("ignore", message=".*EXPERIMENTAL.*")
+    warnings.filterwarnings("ignore", message=".*non-text parts.*")
+    _warning_filters_installed = True
+
+
+_install_warning_filters()
@@ -1,7 +1,10 @@
 """Agent components for managing conversations and building agents."""
 
-from .agent_builder import AgentBuilder, SkillEnabledAgent
-from .conversation import ConversationManager, ConversationState, Message
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .agent_builder import AgentBuilder, SkillEnabledAgent
+    from .conversation import ConversationManager, ConversationState, Message
 
 __all__ = [
     "AgentBuilder",
@@ -10,3 +13,25 @@ __all__ = [
     "ConversationState",
     "Message",
 ]
+
+# Which submodule defines each public name (PEP 562 lazy imports, so
+# importing conversation helpers does not pull in agent_builder and its
+# transitive dependencies)
+_SUBMODULES = {
+    "AgentBuilder": "agent_builder",
+    "SkillEnabledAgent": "agent_builder",
+    "ConversationManager": "conversation",
+    "ConversationState": "conversation",
+    "Message": "conversation",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _SUBMODULES.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f".{submodule}", __name__), name)
+    globals()[name] = value  # cache so __getattr__ runs once per name
+    return value
@@ -1,9 +1,18 @@
 """Agent builder for constructing agents with Skills support."""
 
+import functools
+import sys
 from pathlib import Path
-from typing import Any, AsyncIterator, Callable, Optional, TYPE_CHECKING
+from secrets import token_hex
+from typing import Any, AsyncIterator, Callable, Optional, Sequence, TYPE_CHECKING
 
+from ..core.script_executor import ExecutionConstraints, ScriptExecutor
 from ..core.skill_meta_tool import SkillMetaTool, SkillActivationResult
+from ..integration.adk_tools import (
+    create_bash_tool_with_skill_executor,
+    create_read_file_tool,
+    create_write_file_tool,
+)
 from ..tools.tool_registry import ToolRegistry
 from .conversation import ConversationManager
 from ..observability.logging_config import get_logger
@@ -13,6 +22,37 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Constant prompt blocks, hoisted so prompt assembly is a single join
+_TOOL_USAGE_BLOCK = (
+    "\n\n## Tool Usage\n\n"
+    "You have access to various tools. To use a skill, call the Skill tool "
+    "with the appropriate skill name. Once a skill is activated, follow its "
+    "specific instructions carefully.\n"
+)
+
+_SKILL_AWARENESS_BLOCK = """
+
+IMPORTANT: Proactively activate skills based on user intent:
+- When a user's request matches a skill's purpose, activate that skill immediately
+- Do NOT wait for the user to explicitly say "activate" or "use" a skill
+- Match the user's intent to available skill descriptions
+
+Once a skill is activated, it remains active - continue following its instructions for all related requests."""
+
+_TOOLS_INFO_BLOCK = (
+    "\n\n**Available Tools**: bash_tool, read_file, write_file "
+    "are now active for this skill."
+)
+
+# Shared result for the no-active-skills case (no per-call allocation)
+_EMPTY_SKILLS: tuple[str, ...] = ()
+
+# Interned keys used in per-call dict lookups; interned strings compare
+# by pointer on the dict fast path
+_K_SKILL_NAME = sys.intern("skill_name")
+_K_ACTIVE_SKILL_NAME = sys.intern("active_skill_name")
+_K_ACTIVE_SKILL_DIRECTORY = sys.intern("active_skill_directory")
+
 
 class AgentBuilder:
     """
@@ -68,6 +108,63 @@ class AgentBuilder:
         # Tool handlers (name -> async callable)
         self._tool_handlers: dict[str, Callable] = {}
 
+        # Per-skill [bash, read, write] tool triples, built once per
+        # activation instead of on every tool call
+        self._exec_tools_cache: dict[str, list[Callable]] = {}
+
+        # One-time scripts-directory probe per skill (two stat calls)
+        self._has_scripts: dict[str, bool] = {}
+
+        # Registered tool definitions, snapshotted for get_tools
+        self._cached_tool_defs: Optional[tuple] = None
+
+    def _skill_has_scripts(self, skill_name: str) -> bool:
+        """Whether the skill ships a scripts/ directory (probed once)."""
+        cached = self._has_scripts.get(skill_name)
+        if cached is None:
+            # Discovery already answered this for known skills
+            metadata = self.skill_meta_tool.skills_metadata.get(skill_name)
+            if metadata is not None and metadata.directory is not None:
+                cached = metadata.has_scripts
+            else:
+                cached = (self.skills_dir / skill_name / "scripts").is_dir()
+            self._has_scripts[skill_name] = cached
+        return cached
+
+    @functools.cached_property
+    def skill_listing(self) -> str:
+        """
+        Preformatted skill catalog used in the skill tool docstring.
+
+        Computed once per builder from the per-line cache that SkillMetaTool
+        populates at metadata load, so no f-string formatting happens here.
+        Invalidate with `del self.skill_listing` after reloading skills.
+        """
+        return "\n".join(self.skill_meta_tool._formatted_lines.values())
+
+    @functools.cached_property
+    def skill_tool_docstring(self) -> str:
+        """
+        Complete docstring for the skill tool, built once per builder.
+
+        Constant for a given skill catalog, so agent creation assigns it
+        instead of re-rendering the template. Invalidate together with
+        `skill_listing` after reloading skills.
+        """
+        return f"""Activate a specialized skill based on user intent.
+
+IMPORTANT: Call this automatically when user's request matches a skill's purpose.
+Do NOT wait for explicit activation - proactively match intent to skills.
+
+Available skills:
+{self.skill_listing}
+
+Args:
+    skill_name: Name of skill to activate.
+
+Returns:
+    Skill instructions to follow for the conversation."""
+
     def register_tool(
         self,
         name: str,
@@ -87,6 +184,7 @@ class AgentBuilder:
         """
         logger.info(f"Registering tool: {name}")
         self.tool_registry.register_tool(name, definition)
+        self._cached_tool_defs = None
         if handler:
             self._tool_handlers[name] = handler
             logger.debug(f"Tool handler registered for: {name}")
@@ -102,22 +200,15 @@ class AgentBuilder:
         Returns:
             Complete system prompt with skills metadata
         """
-        prompt = base_instruction
-
-        # Add skills section (metadata only - progressive disclosure)
+        # Skills section is metadata only (progressive disclosure) and is
+        # cached by the meta-tool; one join builds the final string
         skills_section = self.skill_meta_tool.get_system_prompt_section()
+        parts = [base_instruction]
         if skills_section:
-            prompt += "\n\n" + skills_section
-
-        # Add tool usage guidelines
-        prompt += "\n\n## Tool Usage\n\n"
-        prompt += (
-            "You have access to various tools. To use a skill, call the Skill tool "
-            "with the appropriate skill name. Once a skill is activated, follow its "
-            "specific instructions carefully.\n"
-        )
-
-        return prompt
+            parts.append("\n\n")
+            parts.append(skills_section)
+        parts.append(_TOOL_USAGE_BLOCK)
+        return "".join(parts)
 
     def get_tools(
         self,
@@ -132,10 +223,15 @@ class AgentBuilder:
         Returns:
             List of all tool definitions
         """
-        tools = []
+        # Registered tools (includes the Skill meta-tool) change only on
+        # register_tool, so snapshot them once instead of re-listing the
+        # registry on every LLM turn
+        if self._cached_tool_defs is None:
+            self._cached_tool_defs = tuple(
+                self.tool_registry.get_all_tool_definitions()
+            )
 
-        # Add all registered tools (includes Skill meta-tool)
-        tools.extend(self.tool_registry.get_all_tool_definitions())
+        tools = list(self._cached_tool_defs)
 
         # Add additional tools if provided
         if additional_tools:
@@ -211,21 +307,21 @@ class AgentBuilder:
         Returns:
             Tool execution result
         """
-        # Special handling for Skill meta-tool
+        # Special handling for Skill meta-tool: it needs the session for
+        # message injection, which registered handlers (taking only
+        # tool_input and context) never see
         if tool_name == "Skill":
             return await self.handle_skill_activation(
-                skill_name=tool_input.get("skill_name", ""),
+                skill_name=tool_input.get(_K_SKILL_NAME, ""),
                 session_id=session_id,
                 current_context=current_context,
             )
 
-        # Check for registered handler
-        if tool_name in self._tool_handlers:
-            handler = self._tool_handlers[tool_name]
-            return await handler(tool_input, current_context or {})
-
-        # No handler found
-        raise ValueError(f"No handler registered for tool: {tool_name}")
+        # Single fused lookup instead of a membership test plus a getitem
+        handler = self._tool_handlers.get(tool_name)
+        if handler is None:
+            raise ValueError(f"No handler registered for tool: {tool_name}")
+        return await handler(tool_input, current_context or {})
 
     def create_session(self, session_id: str) -> str:
         """
@@ -269,15 +365,20 @@ class AgentBuilder:
         """Add assistant message to conversation."""
         self.conversation_manager.add_assistant_message(session_id, content)
 
-    def get_active_skills(self, session_id: str) -> list[str]:
-        """Get list of active skills in session."""
+    def get_active_skills(self, session_id: str) -> Sequence[str]:
+        """Get the active skills in a session.
+
+        Returns a snapshot tuple so callers cannot mutate the
+        conversation state's internal list.
+        """
         state = self.conversation_manager.get_conversation(session_id)
-        return state.active_skills if state else []
+        return tuple(state.active_skills) if state else _EMPTY_SKILLS
 
     def deactivate_skill(self, session_id: str, skill_name: str) -> None:
         """Deactivate a skill in the session."""
         self.skill_meta_tool.deactivate_skill(skill_name)
         self.conversation_manager.deactivate_skill(session_id, skill_name)
+        self._exec_tools_cache.pop(skill_name, None)
 
     # =========================================================================
     # Adapter Integration - Simplified Agent Creation
@@ -322,9 +423,9 @@ class AgentBuilder:
         """
         # Generate session ID if not provided
         if session_id is None:
-            import uuid
-
-            session_id = f"session-{uuid.uuid4().hex[:8]}"
+            # 8 hex chars straight from os.urandom; uuid4 would draw 16
+            # random bytes and slice most of them away
+            session_id = f"session-{token_hex(4)}"
 
         logger.info(f"Creating agent: {name}, session_id={session_id}")
 
@@ -334,10 +435,8 @@ class AgentBuilder:
         # Build skill tool with dynamic docstring
         skill_tool = self._create_skill_tool(session_id)
 
-        # Create universal execution tools that work with active skill context
-        bash_tool = self._create_universal_bash_tool(session_id)
-        read_file_tool = self._create_universal_read_file_tool(session_id)
-        write_file_tool = self._create_universal_write_file_tool(session_id)
+        # Universal execution tools share one session-bound dispatcher
+        dispatcher = _SkillToolDispatcher(self, session_id)
 
         # Build system prompt with skill awareness
         system_prompt = self._build_skill_aware_prompt(instruction)
@@ -347,7 +446,12 @@ class AgentBuilder:
             name=name,
             instruction=system_prompt,
             description=description or f"{name} with skill support",
-            tools=[skill_tool, bash_tool, read_file_tool, write_file_tool],
+            tools=[
+                skill_tool,
+                dispatcher.bash_tool,
+                dispatcher.read_file,
+                dispatcher.write_file,
+            ],
         )
 
         return SkillEnabledAgent(
@@ -368,73 +472,9 @@ class AgentBuilder:
             session_id: Session ID for tracking activations
 
         Returns:
-            Callable skill tool function
+            Callable skill tool object
         """
-        skill_meta_tool = self.skill_meta_tool
-        conversation_manager = self.conversation_manager
-
-        # Build skill list from metadata
-        skill_list = "\n".join(
-            f"        - {name}: {meta.description}"
-            for name, meta in skill_meta_tool.skills_metadata.items()
-        )
-
-        def skill_tool(skill_name: str) -> str:
-            """Activate a skill - docstring replaced dynamically."""
-            try:
-                # Progressive disclosure: load full content ON-DEMAND
-                skill_content = skill_meta_tool.loader.load_skill(skill_name)
-                metadata = skill_meta_tool.skills_metadata.get(skill_name)
-
-                if not metadata:
-                    available = list(skill_meta_tool.skills_metadata.keys())
-                    return f"Skill '{skill_name}' not found. Available: {available}"
-
-                # Track activation
-                conversation_manager.activate_skill(session_id, skill_name)
-
-                # Store skill context for tool creation
-                skill_directory = self.skills_dir / skill_name
-                conversation_manager.update_context(
-                    session_id=session_id,
-                    context_updates={
-                        "active_skill_name": skill_name,
-                        "active_skill_directory": str(skill_directory),
-                    },
-                )
-
-                # Check if skill has scripts
-                scripts_dir = skill_directory / "scripts"
-                if scripts_dir.exists() and scripts_dir.is_dir():
-                    tools_info = "\n\n**Available Tools**: bash_tool, read_file, write_file are now active for this skill."
-                else:
-                    tools_info = ""
-
-                # Return full instructions (loaded on-demand, not at startup)
-                return f"""# Skill Activated: {skill_name} (v{metadata.version})
-
-{skill_content.instructions}{tools_info}
-
-This skill remains active. Apply these instructions to related requests."""
-            except Exception as e:
-                return f"Error activating skill '{skill_name}': {e}"
-
-        # Set dynamic docstring with skill metadata
-        skill_tool.__doc__ = f"""Activate a specialized skill based on user intent.
-
-IMPORTANT: Call this automatically when user's request matches a skill's purpose.
-Do NOT wait for explicit activation - proactively match intent to skills.
-
-Available skills:
-{skill_list}
-
-Args:
-    skill_name: Name of skill to activate.
-
-Returns:
-    Skill instructions to follow for the conversation."""
-
-        return skill_tool
+        return _SkillTool(self, session_id)
 
     def _build_skill_aware_prompt(self, base_instruction: str) -> str:
         """
@@ -446,16 +486,7 @@ Returns:
         Returns:
             Complete system prompt with skill metadata and usage guidelines
         """
-        skill_awareness = """
-
-IMPORTANT: Proactively activate skills based on user intent:
-- When a user's request matches a skill's purpose, activate that skill immediately
-- Do NOT wait for the user to explicitly say "activate" or "use" a skill
-- Match the user's intent to available skill descriptions
-
-Once a skill is activated, it remains active - continue following its instructions for all related requests."""
-
-        return self.build_system_prompt(base_instruction + skill_awareness)
+        return self.build_system_prompt(base_instruction + _SKILL_AWARENESS_BLOCK)
 
     def _create_execution_tools_for_skill(self, skill_name: str) -> list[Callable]:
         """
@@ -470,25 +501,23 @@ Once a skill is activated, it remains active - continue following its instructio
         Returns:
             List of tool functions for ADK Agent
         """
-        from ..integration.adk_tools import (
-            create_bash_tool_with_skill_executor,
-            create_read_file_tool,
-            create_write_file_tool,
-        )
-        from ..core.script_executor import ScriptExecutor, ExecutionConstraints
+        cached = self._exec_tools_cache.get(skill_name)
+        if cached is not None:
+            return cached
 
         tools: list[Callable] = []
 
         # Get skill metadata and directory
         metadata = self.skill_meta_tool.skills_metadata.get(skill_name)
         if not metadata:
+            self._exec_tools_cache[skill_name] = tools
             return tools
 
         skill_directory = self.skills_dir / skill_name
-        scripts_dir = skill_directory / "scripts"
 
         # Only create tools if skill has scripts directory
-        if not scripts_dir.exists() or not scripts_dir.is_dir():
+        if not self._skill_has_scripts(skill_name):
+            self._exec_tools_cache[skill_name] = tools
             return tools
 
         # Create ScriptExecutor with skill's constraints
@@ -516,150 +545,171 @@ Once a skill is activated, it remains active - continue following its instructio
         tools.append(read_tool)
         tools.append(write_tool)
 
+        self._exec_tools_cache[skill_name] = tools
         return tools
 
-    def _create_universal_bash_tool(
-        self, session_id: str
-    ) -> Callable[[str, Optional[str]], str]:
-        """
-        Create a universal bash_tool that works with the currently active skill.
-
-        This tool checks if a skill with scripts is active and uses its ScriptExecutor.
-
-        Args:
-            session_id: Session ID for context lookup
-
-        Returns:
-            Callable bash_tool function
-        """
-        conversation_manager = self.conversation_manager
-
-        def bash_tool(command: str, working_directory: Optional[str] = None) -> str:
-            """Execute a bash command using the active skill's permissions.
-
-            IMPORTANT: Only works when a skill with scripts is active.
-            Commands are restricted by the skill's allowed-tools permissions.
-
-            Args:
-                command: The bash command to execute
-                working_directory: Optional working directory (relative to skill directory)
+# Callable skill-activation tool bound to a session. Replaces the nested
+# function the builder used to define per create_agent call: no fresh
+# code/function objects per agent, and the state reads inside __call__
+# are attribute loads instead of closure-cell dereferences. __name__ and
+# __doc__ are set per instance because agent frameworks introspect them
+# off the callable (which is also why the class carries no docstring:
+# one would occupy the __doc__ slot as a class variable).
+class _SkillTool:
+    __slots__ = ("_builder", "_session_id", "__name__", "__doc__")
+
+    def __init__(self, builder: AgentBuilder, session_id: str):
+        self._builder = builder
+        self._session_id = session_id
+        self.__name__ = "skill_tool"
+        self.__doc__ = builder.skill_tool_docstring
+
+    def __call__(self, skill_name: str) -> str:
+        builder = self._builder
+        skill_meta_tool = builder.skill_meta_tool
+        try:
+            # Progressive disclosure: load full content ON-DEMAND
+            skill_content = skill_meta_tool.loader.load_skill(skill_name)
+            metadata = skill_meta_tool.skills_metadata.get(skill_name)
+
+            if not metadata:
+                available = list(skill_meta_tool.skills_metadata.keys())
+                return f"Skill '{skill_name}' not found. Available: {available}"
+
+            # Track activation
+            builder.conversation_manager.activate_skill(self._session_id, skill_name)
+
+            # Store skill context for tool creation (precomputed at
+            # metadata discovery - no path building on activation)
+            skill_directory = metadata.directory or builder.skills_dir / skill_name
+            builder.conversation_manager.update_context(
+                session_id=self._session_id,
+                context_updates={
+                    _K_ACTIVE_SKILL_NAME: skill_name,
+                    _K_ACTIVE_SKILL_DIRECTORY: str(skill_directory),
+                },
+            )
 
-            Returns:
-                Command output or error message
-            """
-            # Get conversation state
-            state = conversation_manager.get_conversation(session_id)
-            if not state:
-                return "Error: No active session. Activate a skill first."
+            # Precomputed at discovery; no filesystem probe here
+            tools_info = _TOOLS_INFO_BLOCK if metadata.has_scripts else ""
+
+            # Return full instructions (loaded on-demand, not at
+            # startup). Instructions can be kilobytes, so one join
+            # sizes the output buffer from the parts instead of
+            # copying them through f-string interpolation.
+            return "".join(
+                (
+                    "# Skill Activated: ",
+                    skill_name,
+                    " (v",
+                    metadata.version,
+                    ")\n\n",
+                    skill_content.instructions,
+                    tools_info,
+                    "\n\nThis skill remains active. "
+                    "Apply these instructions to related requests.",
+                )
+            )
+        except Exception as e:
+            return f"Error activating skill '{skill_name}': {e}"
 
-            # Check if there's an active skill
-            if not state.active_skills:
-                return "Error: No skill is currently active. Activate a skill with scripts before using bash_tool."
 
-            # Get the active skill name
-            active_skill = state.active_skills[-1]  # Most recently activated
+class _SkillToolDispatcher:
+    """
+    Session-bound dispatch for the universal execution tools.
 
-            # Create executor for this skill
-            execution_tools = self._create_execution_tools_for_skill(active_skill)
-            if not execution_tools:
-                return f"Error: Skill '{active_skill}' does not have scripts directory. Cannot execute commands."
+    One instance replaces the three closures create_agent used to build:
+    the state lookup and active-skill resolution are shared in _resolve,
+    and the bound methods bash_tool/read_file/write_file are what gets
+    handed to the adapter (ADK only needs callables with docstrings).
+    """
 
-            # Use the bash tool (first in list)
-            bash_executor = execution_tools[0]
-            return bash_executor(command, working_directory)
+    __slots__ = ("_builder", "_session_id")
 
-        return bash_tool
+    def __init__(self, builder: AgentBuilder, session_id: str):
+        self._builder = builder
+        self._session_id = session_id
 
-    def _create_universal_read_file_tool(self, session_id: str) -> Callable[[str], str]:
+    def _resolve(
+        self, activate_hint: str
+    ) -> tuple[Optional[list[Callable]], str, str]:
         """
-        Create a universal read_file tool that works with the currently active skill.
-
-        Args:
-            session_id: Session ID for context lookup
+        Look up the active skill's execution tools for this session.
 
         Returns:
-            Callable read_file function
+            (tools, active_skill, error) - error is non-empty when no
+            session or skill is active; tools may still be empty when the
+            active skill ships no scripts.
         """
-        conversation_manager = self.conversation_manager
-
-        def read_file(file_path: str) -> str:
-            """Read a file from the active skill's directory.
+        state = self._builder.conversation_manager.get_conversation(self._session_id)
+        if not state:
+            return None, "", "Error: No active session. Activate a skill first."
 
-            Args:
-                file_path: Relative path to file from skill directory
+        active_skill = state.last_active_skill  # Most recently activated
+        if active_skill is None:
+            return None, "", f"Error: No skill is currently active. {activate_hint}"
 
-            Returns:
-                File contents or error message
-            """
-            # Get conversation state
-            state = conversation_manager.get_conversation(session_id)
-            if not state:
-                return "Error: No active session. Activate a skill first."
+        tools = self._builder._create_execution_tools_for_skill(active_skill)
+        return tools, active_skill, ""
 
-            # Check if there's an active skill
-            if not state.active_skills:
-                return "Error: No skill is currently active. Activate a skill before using read_file."
+    def bash_tool(self, command: str, working_directory: Optional[str] = None) -> str:
+        """Execute a bash command using the active skill's permissions.
 
-            # Get the active skill name
-            active_skill = state.active_skills[-1]
-
-            # Create executor for this skill
-            execution_tools = self._create_execution_tools_for_skill(active_skill)
-            if not execution_tools or len(execution_tools) < 2:
-                return f"Error: Skill '{active_skill}' does not have file I/O tools."
-
-            # Use the read_file tool (second in list)
-            read_executor = execution_tools[1]
-            return read_executor(file_path)
-
-        return read_file
-
-    def _create_universal_write_file_tool(
-        self, session_id: str
-    ) -> Callable[[str, str], str]:
-        """
-        Create a universal write_file tool that works with the currently active skill.
+        IMPORTANT: Only works when a skill with scripts is active.
+        Commands are restricted by the skill's allowed-tools permissions.
 
         Args:
-            session_id: Session ID for context lookup
+            command: The bash command to execute
+            working_directory: Optional working directory (relative to skill directory)
 
         Returns:
-            Callable write_file function
+            Command output or error message
         """
-        conversation_manager = self.conversation_manager
-
-        def write_file(file_path: str, content: str) -> str:
-            """Write content to a file in the active skill's directory.
-
-            Args:
-                file_path: Relative path to file from skill directory
-                content: Content to write
+        tools, active_skill, error = self._resolve(
+            "Activate a skill with scripts before using bash_tool."
+        )
+        if error:
+            return error
+        if not tools:
+            return f"Error: Skill '{active_skill}' does not have scripts directory. Cannot execute commands."
+        return tools[0](command, working_directory)
 
-            Returns:
-                Success message or error
-            """
-            # Get conversation state
-            state = conversation_manager.get_conversation(session_id)
-            if not state:
-                return "Error: No active session. Activate a skill first."
+    def read_file(self, file_path: str) -> str:
+        """Read a file from the active skill's directory.
 
-            # Check if there's an active skill
-            if not state.active_skills:
-                return "Error: No skill is currently active. Activate a skill before using write_file."
+        Args:
+            file_path: Relative path to file from skill directory
 
-            # Get the active skill name
-            active_skill = state.active_skills[-1]
+        Returns:
+            File contents or error message
+        """
+        tools, active_skill, error = self._resolve(
+            "Activate a skill before using read_file."
+        )
+        if error:
+            return error
+        if not tools or len(tools) < 2:
+            return f"Error: Skill '{active_skill}' does not have file I/O tools."
+        return tools[1](file_path)
 
-            # Create executor for this skill
-            execution_tools = self._create_execution_tools_for_skill(active_skill)
-            if not execution_tools or len(execution_tools) < 3:
-                return f"Error: Skill '{active_skill}' does not have file I/O tools."
+    def write_file(self, file_path: str, content: str) -> str:
+        """Write content to a file in the active skill's directory.
 
-            # Use the write_file tool (third in list)
-            write_executor = execution_tools[2]
-            return write_executor(file_path, content)
+        Args:
+            file_path: Relative path to file from skill directory
+            content: Content to write
 
-        return write_file
+        Returns:
+            Success message or error
+        """
+        tools, active_skill, error = self._resolve(
+            "Activate a skill before using write_file."
+        )
+        if error:
+            return error
+        if not tools or len(tools) < 3:
+            return f"Error: Skill '{active_skill}' does not have file I/O tools."
+        return tools[2](file_path, content)
 
 
 class SkillEnabledAgent:
@@ -669,8 +719,19 @@ class SkillEnabledAgent:
     Provides a simple API for interacting with the agent:
     - chat(): Send messages and get responses
     - get_active_skills(): Check which skills are active
+
+    One instance exists per session, so attributes live in __slots__ to
+    keep the per-session footprint down in long-lived server processes.
     """
 
+    __slots__ = (
+        "_builder",
+        "_adapter",
+        "_session_id",
+        "_system_prompt",
+        "_skills_listing",
+    )
+
     def __init__(
         self,
         builder: AgentBuilder,
@@ -682,6 +743,7 @@ class SkillEnabledAgent:
         self._adapter = adapter
         self._session_id = session_id
         self._system_prompt = system_prompt
+        self._skills_listing: Optional[str] = None
 
     @property
     def session_id(self) -> str:
@@ -689,7 +751,7 @@ class SkillEnabledAgent:
         return self._session_id
 
     @property
-    def active_skills(self) -> list[str]:
+    def active_skills(self) -> Sequence[str]:
         """Get list of currently active skills."""
         return self._builder.get_active_skills(self._session_id)
 
@@ -701,6 +763,20 @@ class SkillEnabledAgent:
             for name, meta in self._builder.skill_meta_tool.skills_metadata.items()
         }
 
+    @property
+    def available_skills_listing(self) -> str:
+        """Preformatted one-line-per-skill listing for display.
+
+        Cached manually in a slot; cached_property needs an instance
+        __dict__, which __slots__ removes.
+        """
+        if self._skills_listing is None:
+            self._skills_listing = "\n".join(
+                f"  - {name}: {meta.description}"
+                for name, meta in self._builder.skill_meta_tool.skills_metadata.items()
+            )
+        return self._skills_listing
+
     async def chat(self, message: str) -> str:
         """
         Send a message and get a response.
@@ -724,7 +800,6 @@ class SkillEnabledAgent:
         response = await self._adapter.send_message(
             messages=self._builder.get_messages_for_api(self._session_id),
             system_prompt=self._system_prompt,
-            tools=[],  # Tools registered with agent, not per-message
             session_id=self._session_id,
         )
 
@@ -738,8 +813,13 @@ class SkillEnabledAgent:
         """
         Send a message and stream the response.
 
-        Note: Streaming support depends on adapter implementation.
-        Falls back to non-streaming if not supported.
+        Yields text chunks as they arrive from the adapter, so callers can
+        show output at first-token latency instead of waiting for the full
+        generation. Adapters without native streaming inherit the base
+        adapter's send_message_streaming, which yields the complete
+        response as one final chunk, so no capability check is needed
+        here. Message tracking is handled automatically: the accumulated
+        text is recorded as the assistant message at the end.
 
         Args:
             message: User message
@@ -747,7 +827,35 @@ class SkillEnabledAgent:
         Yields:
             Response text chunks
         """
-        # For now, fall back to non-streaming
-        # TODO: Implement streaming when adapter supports it
-        response = await self.chat(message)
-        yield response
+        # Track user message
+        self._builder.add_user_message(self._session_id, message)
+
+        collected: list[str] = []
+        async for chunk in self._adapter.send_message_streaming(
+            messages=self._builder.get_messages_for_api(self._session_id),
+            system_prompt=self._system_prompt,
+            session_id=self._session_id,
+        ):
+            if chunk.is_streaming:
+                if chunk.content:
+                    collected.append(chunk.content)
+                    yield chunk.content
+                continue
+
+            # Final chunk carries the complete text; yield only the part
+            # that wasn't already streamed incrementally
+            final = chunk.content or ""
+            streamed = "".join(collected)
+            if final and final != streamed:
+                if final.startswith(streamed):
+                    tail = final[len(streamed) :]
+                    collected.append(tail)
+                    yield tail
+                else:
+                    collected = [final]
+                    yield final
+
+        # Track assistant response
+        full_response = "".join(collected)
+        if full_response:
+            self._builder.add_assistant_message(self._session_id, full_response)
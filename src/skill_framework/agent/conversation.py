@@ -1,6 +1,12 @@
 """Conversation manager for managing conversation state and message history."""
 
+import json
+import tempfile
+import time
+from collections import deque
 from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
 from typing import Any, Optional
 
 from dataclasses import dataclass, field
@@ -9,34 +15,98 @@ from ..observability.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# In-memory window per conversation. Older messages spill to a JSONL
+# rollout file so the hot path stays bounded for very long sessions.
+CONV_MAX_INMEM = 1000
 
-@dataclass
+# Per-second cache for the ISO timestamp prefix. Building the full
+# string via datetime.now().isoformat() walks the strftime machinery on
+# every message; within one second only the microseconds change, so the
+# date/time prefix is formatted once and reused.
+_iso_second = 0
+_iso_prefix = ""
+
+
+def _iso_now() -> str:
+    """Current UTC time as an ISO-8601 string (cached per second)."""
+    global _iso_second, _iso_prefix
+    t = time.time()
+    sec = int(t)
+    if sec != _iso_second:
+        _iso_prefix = datetime.fromtimestamp(sec, timezone.utc).isoformat()[:19]
+        _iso_second = sec
+    return f"{_iso_prefix}.{int((t - sec) * 1_000_000):06d}+00:00"
+
+
+# slots=True drops the per-instance __dict__; with thousands of messages
+# per busy deployment that is most of a Message's footprint
+@dataclass(slots=True)
 class Message:
     """Single conversation message"""
 
     role: str
     content: Any
-    timestamp: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
-    )
+    timestamp: str = field(default_factory=_iso_now)
     metadata: dict[str, Any] = field(default_factory=dict)
     isMeta: bool = False
 
 
-@dataclass
+# Free-list of recycled Message instances. Busy multi-tenant
+# deployments churn through short-lived messages; reusing evicted and
+# deleted ones keeps allocator and gc pressure down. Bounded so an idle
+# process does not hoard memory.
+_MSG_POOL: "deque[Message]" = deque(maxlen=4096)
+
+
+def _new_message(
+    role: str,
+    content: Any,
+    metadata: Optional[dict[str, Any]] = None,
+    isMeta: bool = False,
+) -> Message:
+    """Build a Message, recycling a pooled instance when available."""
+    if _MSG_POOL:
+        message = _MSG_POOL.popleft()
+        message.role = role
+        message.content = content
+        message.timestamp = _iso_now()
+        message.metadata = metadata if metadata is not None else {}
+        message.isMeta = isMeta
+        return message
+    return Message(role=role, content=content, metadata=metadata or {}, isMeta=isMeta)
+
+
+def _release_message(message: Message) -> None:
+    """Return a Message to the pool, dropping its payload references."""
+    message.content = None
+    message.metadata = {}
+    _MSG_POOL.append(message)
+
+
+@dataclass(slots=True)
 class ConversationState:
     """State of ongoing conversation"""
 
     session_id: str
-    messages: list[Message] = field(default_factory=list)
+    # Bounded window of recent messages; the manager spills evicted
+    # messages to disk before they fall off the left end
+    messages: "deque[Message]" = field(
+        default_factory=lambda: deque(maxlen=CONV_MAX_INMEM)
+    )
+    # Append-only cache of API-shaped dicts, kept in sync with `messages`
+    # by get_messages_for_api (avoids rebuilding the list every turn)
+    api_messages: list[dict[str, Any]] = field(default_factory=list)
+    # Meta-filtered view of api_messages, same append-only discipline;
+    # api_no_meta_synced counts how many entries of `messages` it covers
+    api_messages_no_meta: list[dict[str, Any]] = field(default_factory=list)
+    api_no_meta_synced: int = 0
     active_skills: list[str] = field(default_factory=list)
+    # Mirror of active_skills[-1] so per-tool-call reads are a single
+    # attribute load (maintained by activate/deactivate_skill)
+    last_active_skill: Optional[str] = None
     context: dict[str, Any] = field(default_factory=dict)
-    created_at: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
-    )
-    updated_at: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
-    )
+    created_at: str = field(default_factory=_iso_now)
+    updated_at: str = field(default_factory=_iso_now)
 
 
 class ConversationManager:
@@ -64,6 +134,63 @@ class ConversationManager:
         """Get existing conversation"""
         return self.conversations.get(session_id)
 
+    def delete_conversation(self, session_id: str) -> None:
+        """Drop a conversation and recycle its messages."""
+        state = self.conversations.pop(session_id, None)
+        if state is None:
+            return
+        for message in state.messages:
+            _release_message(message)
+        state.messages.clear()
+        logger.info(f"Conversation deleted: {session_id}")
+
+    def _spill(self, session_id: str, message: Message) -> None:
+        """Append an evicted message to the session's rollout file."""
+        path = (
+            Path(tempfile.gettempdir())
+            / f"skill_framework_rollout_{session_id}.jsonl"
+        )
+        record = {
+            "role": message.role,
+            "content": message.content,
+            "timestamp": message.timestamp,
+            "metadata": message.metadata,
+            "isMeta": message.isMeta,
+        }
+        with path.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps(record, default=str) + "\n")
+
+    def _append_message(self, state: ConversationState, message: Message) -> None:
+        """Append within the bounded window, spilling the oldest first.
+
+        The API caches index-align with `messages`, so an eviction shifts
+        their fronts (and the no-meta sync counter) in lockstep.
+        """
+        messages = state.messages
+        if messages.maxlen is not None and len(messages) == messages.maxlen:
+            evicted = messages.popleft()
+            self._spill(state.session_id, evicted)
+            if state.api_messages:
+                del state.api_messages[0]
+            if state.api_no_meta_synced:
+                state.api_no_meta_synced -= 1
+                if not evicted.isMeta and state.api_messages_no_meta:
+                    del state.api_messages_no_meta[0]
+            _release_message(evicted)
+        messages.append(message)
+
+        # Extend the API caches now while the new message is at hand, so
+        # fully-synced buffers make get_messages_for_api a plain return.
+        # Caches lagging behind (e.g. after direct appends to
+        # state.messages) are left for the lazy sync to catch up in order.
+        if len(state.api_messages) == len(messages) - 1:
+            api_msg = {"role": message.role, "content": message.content}
+            state.api_messages.append(api_msg)
+            if state.api_no_meta_synced == len(messages) - 1:
+                if not message.isMeta:
+                    state.api_messages_no_meta.append(api_msg)
+                state.api_no_meta_synced = len(messages)
+
     def add_user_message(
         self,
         session_id: str,
@@ -75,14 +202,10 @@ class ConversationManager:
         if not state:
             state = self.create_conversation(session_id)
 
-        message = Message(
-            role="user",
-            content=content,
-            metadata=metadata or {},
-        )
+        message = _new_message(role="user", content=content, metadata=metadata)
 
-        state.messages.append(message)
-        state.updated_at = datetime.now(timezone.utc).isoformat()
+        self._append_message(state, message)
+        state.updated_at = _iso_now()
         logger.debug(
             f"User message added to {session_id}, content_length={len(content)}"
         )
@@ -98,14 +221,10 @@ class ConversationManager:
         if not state:
             raise ValueError(f"Conversation {session_id} not found")
 
-        message = Message(
-            role="assistant",
-            content=content,
-            metadata=metadata or {},
-        )
+        message = _new_message(role="assistant", content=content, metadata=metadata)
 
-        state.messages.append(message)
-        state.updated_at = datetime.now(timezone.utc).isoformat()
+        self._append_message(state, message)
+        state.updated_at = _iso_now()
         logger.debug(f"Assistant message added to {session_id}")
 
     def inject_skill_messages(
@@ -127,23 +246,23 @@ class ConversationManager:
         skill_name = metadata_message.get("metadata", {}).get("skill_name", "unknown")
         logger.info(f"Injecting skill messages for {skill_name} in {session_id}")
 
-        msg1 = Message(
+        msg1 = _new_message(
             role=metadata_message["role"],
             content=metadata_message["content"],
             metadata=metadata_message.get("metadata", {}),
             isMeta=False,
         )
-        state.messages.append(msg1)
+        self._append_message(state, msg1)
 
-        msg2 = Message(
+        msg2 = _new_message(
             role=instruction_message["role"],
             content=instruction_message["content"],
             metadata=instruction_message.get("metadata", {}),
             isMeta=True,
         )
-        state.messages.append(msg2)
+        self._append_message(state, msg2)
 
-        state.updated_at = datetime.now(timezone.utc).isoformat()
+        state.updated_at = _iso_now()
 
     def get_messages_for_api(
         self,
@@ -164,20 +283,53 @@ class ConversationManager:
         if not state:
             return []
 
-        api_messages = []
-
-        for msg in state.messages:
-            if msg.isMeta and not include_meta:
-                continue
-
-            api_messages.append(
-                {
-                    "role": msg.role,
-                    "content": msg.content,
-                }
+        # Sync the append-only cache with the message list. Appends extend
+        # the tail in O(new messages); a shrink forces a full rebuild, as
+        # does a shifted head - a direct append to a full state.messages
+        # window evicts silently without changing the length, so the head
+        # is identity-checked against its cache entry (cache dicts hold
+        # the very same role/content objects, making a clean sync exact).
+        cached = state.api_messages
+        messages = state.messages
+        stale = len(cached) > len(messages) or (
+            cached
+            and messages
+            and (
+                cached[0]["content"] is not messages[0].content
+                or cached[0]["role"] != messages[0].role
+            )
+        )
+        if stale:
+            del cached[:]
+            del state.api_messages_no_meta[:]
+            state.api_no_meta_synced = 0
+        if len(cached) < len(state.messages):
+            cached.extend(
+                {"role": msg.role, "content": msg.content}
+                for msg in islice(state.messages, len(cached), None)
             )
 
-        return api_messages
+        if include_meta:
+            # Live buffer - callers must treat it as read-only
+            return cached
+
+        # Same incremental sync for the meta-filtered view: only the
+        # messages appended since the last call are re-examined
+        visible = state.api_messages_no_meta
+        if state.api_no_meta_synced > len(state.messages):
+            del visible[:]
+            state.api_no_meta_synced = 0
+        if state.api_no_meta_synced < len(state.messages):
+            start = state.api_no_meta_synced
+            visible.extend(
+                api_msg
+                for msg, api_msg in zip(
+                    islice(state.messages, start, None), islice(cached, start, None)
+                )
+                if not msg.isMeta
+            )
+            state.api_no_meta_synced = len(state.messages)
+        return visible
 
     def get_visible_messages(self, session_id: str) -> list[dict[str, Any]]:
         """Get only visible messages (for UI display)"""
@@ -201,13 +353,14 @@ class ConversationManager:
         state = self.get_conversation(session_id)
         if state:
             state.context.update(context_updates)
-            state.updated_at = datetime.now(timezone.utc).isoformat()
+            state.updated_at = _iso_now()
 
     def activate_skill(self, session_id: str, skill_name: str) -> None:
         """Mark skill as active in conversation"""
         state = self.get_conversation(session_id)
         if state and skill_name not in state.active_skills:
             state.active_skills.append(skill_name)
+            state.last_active_skill = skill_name
             logger.info(f"Skill activated: {skill_name} in session {session_id}")
 
     def deactivate_skill(self, session_id: str, skill_name: str) -> None:
@@ -215,4 +368,7 @@ class ConversationManager:
         state = self.get_conversation(session_id)
         if state and skill_name in state.active_skills:
             state.active_skills.remove(skill_name)
+            state.last_active_skill = (
+                state.active_skills[-1] if state.active_skills else None
+            )
             logger.info(f"Skill deactivated: {skill_name} in session {session_id}")
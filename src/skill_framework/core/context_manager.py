@@ -1,7 +1,7 @@
 """Context manager for skill execution context modifications."""
 
-from copy import deepcopy
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable
 
 from ..observability.logging_config import get_logger
 
@@ -11,6 +11,60 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+# Skill-specific context mutators. The outcome of the old branch ladder
+# depended only on (skill_name, tags), so the applicable mutators are
+# resolved once per combination and cached.
+def _pdf_rules(context: dict[str, Any]) -> None:
+    """PDF processing needs file operations."""
+    context["file_permissions"] = "read_write"
+    context["allowed_file_extensions"] = [".pdf", ".txt", ".json"]
+
+
+def _data_analysis_rules(context: dict[str, Any]) -> None:
+    """Data analysis needs more memory."""
+    context["max_memory"] = max(context.get("max_memory", 2048), 4096)
+
+
+def _report_generation_rules(context: dict[str, Any]) -> None:
+    """Report generation needs an output directory."""
+    context["output_directory"] = "/tmp/reports"
+    context["file_permissions"] = "read_write"
+
+
+def _fraud_analysis_rules(context: dict[str, Any]) -> None:
+    """Fraud detection needs database access."""
+    context["database_access"] = True
+    context["allowed_tables"] = ["transactions", "users", "alerts"]
+
+
+_SKILL_RULES: dict[str, Callable[[dict[str, Any]], None]] = {
+    "pdf": _pdf_rules,
+    "report-generation": _report_generation_rules,
+    "fraud-analysis": _fraud_analysis_rules,
+}
+
+_TAG_RULES: dict[str, Callable[[dict[str, Any]], None]] = {
+    "pdf": _pdf_rules,
+    "data-analysis": _data_analysis_rules,
+}
+
+
+@lru_cache(maxsize=256)
+def _resolve_rules(
+    skill_name: str, tags: tuple[str, ...]
+) -> tuple[Callable[[dict[str, Any]], None], ...]:
+    """Resolve which mutators apply to a (skill, tags) combination."""
+    rules: list[Callable[[dict[str, Any]], None]] = []
+    rule = _SKILL_RULES.get(skill_name)
+    if rule is not None:
+        rules.append(rule)
+    for tag in tags:
+        rule = _TAG_RULES.get(tag)
+        if rule is not None and rule not in rules:
+            rules.append(rule)
+    return tuple(rules)
+
+
 class ContextManager:
     """
     Manages execution context modifications for skills.
@@ -51,21 +105,30 @@ class ContextManager:
             Modified execution context
         """
         logger.debug(f"Modifying context for skill: {skill_name}")
-        # Start with current context
-        modified = deepcopy(current_context)
+        # Start with current context. The context is a flat dict of
+        # scalars plus two mutable fields, so a shallow copy with fresh
+        # copies of those fields gives the same isolation as deepcopy
+        # without its memo table and reflective dispatch.
+        modified = dict(current_context)
+        modified["environment_variables"] = dict(
+            current_context.get("environment_variables", {})
+        )
+
+        # Merge tool permissions through one set: dedup on insert instead
+        # of the old list concat + `tool not in list` linear scans
+        allowed = set(current_context.get("allowed_tools", ()))
 
-        # Apply skill-specific tool permissions
         if skill_metadata.required_tools:
-            modified["allowed_tools"] = list(
-                set(modified.get("allowed_tools", []) + skill_metadata.required_tools)
-            )
+            allowed.update(skill_metadata.required_tools)
 
         # Add optional tools if available
         if skill_metadata.optional_tools:
-            available_tools = modified.get("all_available_tools", [])
-            for tool in skill_metadata.optional_tools:
-                if tool in available_tools and tool not in modified["allowed_tools"]:
-                    modified["allowed_tools"].append(tool)
+            available = set(modified.get("all_available_tools", ()))
+            allowed.update(
+                tool for tool in skill_metadata.optional_tools if tool in available
+            )
+
+        modified["allowed_tools"] = list(allowed)
 
         # Apply execution constraints
         if skill_metadata.max_execution_time:
@@ -120,24 +183,10 @@ class ContextManager:
         Returns:
             Modified context with skill-specific adjustments
         """
-        # Example: PDF processing needs file operations
-        if skill_name == "pdf" or "pdf" in skill_metadata.tags:
-            context["file_permissions"] = "read_write"
-            context["allowed_file_extensions"] = [".pdf", ".txt", ".json"]
-
-        # Example: Data analysis needs more memory
-        if "data-analysis" in skill_metadata.tags:
-            context["max_memory"] = max(context.get("max_memory", 2048), 4096)
-
-        # Example: Report generation needs output directory
-        if skill_name == "report-generation":
-            context["output_directory"] = "/tmp/reports"
-            context["file_permissions"] = "read_write"
-
-        # Example: Fraud detection needs database access
-        if skill_name == "fraud-analysis":
-            context["database_access"] = True
-            context["allowed_tables"] = ["transactions", "users", "alerts"]
+        # Rules are resolved once per (skill, tags) pair; repeated
+        # activations apply the cached mutator tuple directly
+        for rule in _resolve_rules(skill_name, tuple(skill_metadata.tags)):
+            rule(context)
 
         return context
 
@@ -146,7 +195,15 @@ class ContextManager:
         Restore default execution context.
 
         Returns:
-            Deep copy of default context
+            Fresh copy of the default context
         """
         logger.info("Restoring default execution context")
-        return deepcopy(self.default_context)
+        # Only allowed_tools and environment_variables are mutable;
+        # give callers fresh copies of those and share the scalars
+        return {
+            **self.default_context,
+            "allowed_tools": list(self.default_context["allowed_tools"]),
+            "environment_variables": dict(
+                self.default_context["environment_variables"]
+            ),
+        }
@@ -10,7 +10,7 @@ import re
 import logging
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict
+from typing import Callable, ClassVar, Optional, List, Dict
 
 # Configure logger for script execution
 logger = logging.getLogger(__name__)
@@ -97,12 +97,19 @@ class ScriptExecutor:
     - Environment isolation
     """
 
+    # Process-wide default stdout sink. Embedding applications (e.g. the
+    # chat server) set this once to observe script output for every
+    # executor without wrapping or patching execute(); individual
+    # instances may override via the on_stdout constructor argument.
+    default_on_stdout: ClassVar[Optional[Callable[[str], None]]] = None
+
     def __init__(
         self,
         skill_name: str,
         skill_directory: Path,
         allowed_tools: Optional[str] = None,
         constraints: Optional[ExecutionConstraints] = None,
+        on_stdout: Optional[Callable[[str], None]] = None,
     ):
         """Initialize ScriptExecutor.
 
@@ -111,6 +118,8 @@ class ScriptExecutor:
             skill_directory: Absolute path to skill directory
             allowed_tools: Comma or space-separated allowed tools string
             constraints: Execution constraints (uses defaults if None)
+            on_stdout: Optional callback invoked with captured stdout after
+                each execution (overrides default_on_stdout)
         """
         self.skill_name = skill_name
         self.skill_directory = Path(skill_directory).resolve()
@@ -118,6 +127,7 @@ class ScriptExecutor:
         self.allowed_tools = self._parse_allowed_tools(allowed_tools or "")
         self.constraints = constraints or ExecutionConstraints()
         self.metrics = ExecutionMetrics()
+        self.on_stdout = on_stdout
 
         # Update constraints with parsed allowed commands
         if self.allowed_tools:
@@ -442,6 +452,10 @@ class ScriptExecutor:
                 },
             )
 
+            sink = self.on_stdout or ScriptExecutor.default_on_stdout
+            if sink is not None and result.stdout:
+                sink(result.stdout)
+
             return ExecutionResult(
                 success=result.returncode == 0,
                 exit_code=result.returncode,
@@ -32,6 +32,10 @@ class SkillMetadata:
     network_access: bool = False
     python_packages: list[str] = field(default_factory=list)
     system_packages: list[str] = field(default_factory=list)
+    # Populated at discovery time by SkillMetaTool so activation reads
+    # precomputed values instead of building paths and statting scripts/
+    directory: Optional[Path] = None
+    has_scripts: bool = False
 
 
 @dataclass
@@ -1,5 +1,9 @@
 """Skill meta-tool for managing skill lifecycle."""
 
+import hashlib
+import os
+import pickle
+import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
@@ -9,6 +13,13 @@ from typing import Any, Optional
 from .script_executor import ExecutionConstraints, ScriptExecutor
 from .skill_loader import SkillContent, SkillLoader, SkillMetadata
 
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _tokenize(text: str) -> set[str]:
+    """Lowercase alphanumeric tokens for keyword matching."""
+    return set(_TOKEN_RE.findall(text.lower()))
+
 
 class SkillActivationMode(Enum):
     """Modes for skill activation."""
@@ -76,6 +87,13 @@ class SkillMetaTool:
 
         # Load metadata only (not full content) - progressive disclosure
         self.skills_metadata: dict[str, SkillMetadata] = {}
+        # Per-skill keyword sets for deterministic intent matching
+        self._keyword_sets: dict[str, frozenset[str]] = {}
+        # Preformatted docstring lines, built once at metadata load so
+        # per-agent construction doesn't redo the f-string formatting
+        self._formatted_lines: dict[str, str] = {}
+        # Rendered system-prompt section (constant per catalog)
+        self._prompt_section: Optional[str] = None
         self._load_all_metadata()
 
         # Skill content cache
@@ -90,18 +108,162 @@ class SkillMetaTool:
 
         Only parses YAML frontmatter, not full content.
         This enables fast startup with minimal memory usage.
+
+        Parsed metadata is persisted to one pickle per skills directory
+        under the user cache dir, so repeated constructions (tests, evals)
+        pay one mtime scan instead of re-parsing every frontmatter. The
+        catalog key (SKILL.md paths and mtimes) is stored inside the
+        payload and compared on read, so a changed catalog overwrites the
+        same file instead of stranding stale entries.
         """
         if not self.skills_dir.exists():
             return
 
-        for skill_path in self.skills_dir.iterdir():
-            if skill_path.is_dir() and (skill_path / "SKILL.md").exists():
-                try:
-                    metadata = self.loader.load_metadata(skill_path.name)
-                    self.skills_metadata[metadata.name] = metadata
-                except Exception:
-                    # Skip invalid skills silently
-                    pass
+        catalog_key = self._catalog_key() if self.cache_enabled else None
+        cache_path = (
+            self._metadata_cache_path() if catalog_key is not None else None
+        )
+
+        cached = self._read_metadata_cache(cache_path, catalog_key)
+        if cached is not None:
+            self.skills_metadata = cached
+        else:
+            for skill_path in self.skills_dir.iterdir():
+                if skill_path.is_dir() and (skill_path / "SKILL.md").exists():
+                    try:
+                        metadata = self.loader.load_metadata(skill_path.name)
+                        self.skills_metadata[metadata.name] = metadata
+                    except Exception:
+                        # Skip invalid skills silently
+                        pass
+            self._write_metadata_cache(cache_path, catalog_key)
+
+        # Derived caches (cheap; rebuilt on both the parse and pickle paths)
+        for name, metadata in self.skills_metadata.items():
+            directory = self.skills_dir / name
+            metadata.directory = directory
+            metadata.has_scripts = (directory / "scripts").is_dir()
+            self._keyword_sets[name] = frozenset(
+                _tokenize(
+                    f"{name} {metadata.description} {' '.join(metadata.tags)}"
+                )
+            )
+            self._formatted_lines[name] = f"        - {name}: {metadata.description}"
+
+    def _catalog_key(self) -> Optional[str]:
+        """Key for the current catalog: SKILL.md paths and mtimes."""
+        try:
+            entries = sorted(
+                f"{path}:{path.stat().st_mtime_ns}".encode()
+                for path in self.skills_dir.glob("*/SKILL.md")
+            )
+        except OSError:
+            return None
+
+        if not entries:
+            return None
+
+        return hashlib.sha256(b"".join(entries)).hexdigest()
+
+    def _metadata_cache_path(self) -> Path:
+        """Cache file for this skills directory (one per directory)."""
+        dir_key = hashlib.sha256(
+            str(self.skills_dir.resolve()).encode()
+        ).hexdigest()[:16]
+        cache_dir = (
+            Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache"))
+            / "skill_framework"
+        )
+        return cache_dir / f"meta-{dir_key}.pkl"
+
+    # Keep at most this many per-directory cache files; ephemeral skills
+    # dirs (tests, temp checkouts) would otherwise accumulate forever
+    _CACHE_MAX_FILES = 64
+
+    def _prune_metadata_cache(self, cache_dir: Path) -> None:
+        """Drop the oldest cache files beyond the per-directory cap."""
+        try:
+            pickles = sorted(
+                cache_dir.glob("meta-*.pkl"),
+                key=lambda p: p.stat().st_mtime_ns,
+            )
+            for stale in pickles[: -self._CACHE_MAX_FILES]:
+                stale.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    def _read_metadata_cache(
+        self, cache_path: Optional[Path], catalog_key: Optional[str]
+    ) -> Optional[dict[str, SkillMetadata]]:
+        """Load pickled metadata, or None on miss/staleness/corruption."""
+        if cache_path is None or catalog_key is None or not cache_path.exists():
+            return None
+
+        try:
+            payload = pickle.loads(cache_path.read_bytes())
+            if (
+                isinstance(payload, tuple)
+                and len(payload) == 2
+                and payload[0] == catalog_key
+                and isinstance(payload[1], dict)
+            ):
+                return payload[1]
+        except Exception:
+            # Corrupt or stale cache - fall back to parsing
+            pass
+        return None
+
+    def _write_metadata_cache(
+        self, cache_path: Optional[Path], catalog_key: Optional[str]
+    ) -> None:
+        """Persist parsed metadata; failures are non-fatal."""
+        if cache_path is None or catalog_key is None or not self.skills_metadata:
+            return
+
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(
+                pickle.dumps((catalog_key, self.skills_metadata))
+            )
+            self._prune_metadata_cache(cache_path.parent)
+        except Exception:
+            pass
+
+    def match_skill(self, text: str, threshold: float = 0.3) -> Optional[str]:
+        """
+        Deterministically match user input to a skill by keyword overlap.
+
+        Computes the Jaccard similarity between the input tokens and each
+        skill's keyword set (built from name, description and tags at
+        metadata load). Useful as a cheap local pre-pass: when the match is
+        confident, callers can steer activation directly instead of relying
+        solely on the LLM's tool-selection round trip.
+
+        Args:
+            text: User input to match
+            threshold: Minimum Jaccard score to accept a match
+
+        Returns:
+            Best matching skill name, or None if no match clears threshold
+        """
+        tokens = _tokenize(text)
+        if not tokens:
+            return None
+
+        best_name: Optional[str] = None
+        best_score = 0.0
+        for name, keywords in self._keyword_sets.items():
+            if not keywords:
+                continue
+            overlap = len(tokens & keywords)
+            if not overlap:
+                continue
+            score = overlap / len(tokens | keywords)
+            if score > best_score:
+                best_score = score
+                best_name = name
+
+        return best_name if best_score >= threshold else None
 
     def get_tool_definition(self) -> dict[str, Any]:
         """
@@ -162,27 +324,32 @@ class SkillMetaTool:
         if not self.skills_metadata:
             return ""
 
-        section = "\n## Available Skills\n\n"
-        section += (
-            "You have access to specialized skills for domain-specific tasks:\n\n"
-        )
+        # Constant for a given catalog; render once and reuse
+        if self._prompt_section is not None:
+            return self._prompt_section
+
+        parts = [
+            "\n## Available Skills\n\n",
+            "You have access to specialized skills for domain-specific tasks:\n\n",
+        ]
 
         for name, metadata in self.skills_metadata.items():
-            section += f"**{name}** (v{metadata.version})\n"
-            section += f"  {metadata.description}\n"
+            parts.append(f"**{name}** (v{metadata.version})\n")
+            parts.append(f"  {metadata.description}\n")
 
             if metadata.tags:
-                section += f"  Tags: {', '.join(metadata.tags)}\n"
+                parts.append(f"  Tags: {', '.join(metadata.tags)}\n")
 
-            section += "\n"
+            parts.append("\n")
 
-        section += (
+        parts.append(
             "IMPORTANT: Proactively activate skills when user requests match a skill's purpose. "
             "Do not wait for explicit activation requests - match user intent to skill descriptions. "
             "Once a skill is activated, it remains active and applies to all related requests.\n"
         )
 
-        return section
+        self._prompt_section = "".join(parts)
+        return self._prompt_section
 
     async def activate_skill(
         self,
@@ -418,6 +585,9 @@ class SkillMetaTool:
     def reload_skills(self) -> None:
         """Reload all skill metadata (for development)."""
         self.skills_metadata.clear()
+        self._keyword_sets.clear()
+        self._formatted_lines.clear()
+        self._prompt_section = None
         self._skill_cache.clear()
         self._load_all_metadata()
 
@@ -184,7 +184,7 @@ class ADKAdapter(BaseLLMAdapter):
         self,
         messages: list[dict[str, Any]],
         system_prompt: str,
-        tools: list[dict[str, Any]],
+        tools: Optional[list[dict[str, Any]]] = None,
         user_id: str = "default_user",
         session_id: str = "default_session",
         **kwargs: Any,
@@ -201,7 +201,8 @@ class ADKAdapter(BaseLLMAdapter):
         Args:
             messages: Conversation history
             system_prompt: System instruction (used if agent needs creation)
-            tools: Tool definitions (used for agent creation)
+            tools: Optional tool definitions (tools are registered with the
+                agent at creation; per-message definitions are ignored)
             user_id: User identifier for the session
             session_id: Session identifier
             **kwargs: Additional options (e.g., agent_name, description)
@@ -301,7 +302,7 @@ class ADKAdapter(BaseLLMAdapter):
         self,
         messages: list[dict[str, Any]],
         system_prompt: str,
-        tools: list[dict[str, Any]],
+        tools: Optional[list[dict[str, Any]]] = None,
         user_id: str = "default_user",
         session_id: str = "default_session",
         **kwargs: Any,
@@ -316,7 +317,8 @@ class ADKAdapter(BaseLLMAdapter):
         Args:
             messages: Conversation history
             system_prompt: System instruction (used if agent needs creation)
-            tools: Tool definitions (used for agent creation)
+            tools: Optional tool definitions (tools are registered with the
+                agent at creation; per-message definitions are ignored)
             user_id: User identifier for the session
             session_id: Session identifier
             **kwargs: Additional options (e.g., agent_name, description)
@@ -75,7 +75,7 @@ class BaseLLMAdapter(ABC):
         self,
         messages: list[dict[str, Any]],
         system_prompt: str,
-        tools: list[dict[str, Any]],
+        tools: Optional[list[dict[str, Any]]] = None,
         **kwargs: Any,
     ) -> LLMResponse:
         """
@@ -84,7 +84,8 @@ class BaseLLMAdapter(ABC):
         Args:
             messages: List of conversation messages
             system_prompt: System instruction
-            tools: List of tool definitions
+            tools: Optional tool definitions (adapters that register tools
+                at agent creation ignore this)
             **kwargs: Provider-specific options
 
         Returns:
@@ -148,7 +149,7 @@ class BaseLLMAdapter(ABC):
         self,
         messages: list[dict[str, Any]],
         system_prompt: str,
-        tools: list[dict[str, Any]],
+        tools: Optional[list[dict[str, Any]]] = None,
         **kwargs: Any,
     ) -> AsyncIterator[LLMResponse]:
         """
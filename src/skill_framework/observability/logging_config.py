@@ -9,6 +9,20 @@ from typing import Any, Dict, Optional
 
 _log_context: ContextVar[Dict[str, Any]] = ContextVar("log_context", default={})
 
+# Prefer orjson for serializing log records - every chat turn emits multiple
+# records, so the faster C serializer is on the hot path. Falls back to stdlib.
+try:
+    import orjson
+
+    def _dumps(obj: Dict[str, Any]) -> str:
+        return orjson.dumps(obj, default=str).decode()
+
+except ImportError:
+    import json
+
+    def _dumps(obj: Dict[str, Any]) -> str:
+        return json.dumps(obj, default=str)
+
 
 class ContextualFormatter(logging.Formatter):
     """Formatter that includes contextual information in log records."""
@@ -24,7 +38,6 @@ class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
 
     def format(self, record: logging.LogRecord) -> str:
-        import json
         from datetime import datetime
 
         log_data = {
@@ -70,7 +83,7 @@ class JSONFormatter(logging.Formatter):
             ]:
                 log_data[key] = value
 
-        return json.dumps(log_data)
+        return _dumps(log_data)
 
 
 def setup_logging(
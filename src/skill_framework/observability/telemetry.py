@@ -13,8 +13,11 @@ Usage:
     # All ADK operations are now automatically traced
 """
 
+import atexit
 import os
+import socket
 from typing import Optional
+from urllib.parse import urlparse
 
 from .logging_config import get_logger
 
@@ -22,10 +25,40 @@ logger = get_logger(__name__)
 
 _initialized = False
 
+# Batch export tuning: queue spans and flush every 50 spans / 5 s instead of
+# POSTing each span to the collector on the hot path between turns.
+_BATCH_DEFAULTS = {
+    "OTEL_BSP_MAX_QUEUE_SIZE": "2048",
+    "OTEL_BSP_SCHEDULE_DELAY": "5000",
+    "OTEL_BSP_MAX_EXPORT_BATCH_SIZE": "50",
+}
+
+
+def _collector_reachable(endpoint: str, timeout: float = 0.25) -> bool:
+    """
+    Quick TCP probe of the Phoenix collector.
+
+    register() blocks on connect timeouts when the collector is down, which
+    stalls startup for seconds. A sub-second socket check lets us skip
+    instrumentation gracefully instead.
+    """
+    parsed = urlparse(endpoint)
+    host = parsed.hostname
+    if not host:
+        return False
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
 
 def setup_telemetry(
     project_name: str = "skill_framework",
     auto_instrument: bool = True,
+    batch: bool = True,
 ) -> Optional[object]:
     """
     Setup Phoenix observability for Google ADK.
@@ -40,10 +73,13 @@ def setup_telemetry(
         PHOENIX_API_KEY: Phoenix API key (required for Phoenix Cloud)
         PHOENIX_COLLECTOR_ENDPOINT: Phoenix endpoint URL
         PHOENIX_CLIENT_HEADERS: Optional headers (for legacy instances)
+        OTEL_BSP_*: Batch span processor tuning (defaults set when batch=True)
 
     Args:
         project_name: Project name for organizing traces in Phoenix
         auto_instrument: Enable automatic instrumentation of ADK operations
+        batch: Use a BatchSpanProcessor so spans are exported in batches
+            off the hot path instead of one HTTP POST per span
 
     Returns:
         TracerProvider instance if successful, None otherwise
@@ -54,19 +90,37 @@ def setup_telemetry(
         logger.warning("Telemetry already initialized, skipping setup")
         return None
 
+    endpoint = os.getenv("PHOENIX_COLLECTOR_ENDPOINT", "http://localhost:6006")
+    if not _collector_reachable(endpoint):
+        logger.warning(
+            f"Phoenix collector unreachable at {endpoint}, skipping telemetry setup"
+        )
+        return None
+
     try:
         from phoenix.otel import register
 
         logger.info(f"Initializing Phoenix telemetry: project={project_name}")
 
+        if batch:
+            # BatchSpanProcessor reads its queue/delay/batch-size from these
+            # standard OTEL env vars; only set them if the user hasn't.
+            for var, default in _BATCH_DEFAULTS.items():
+                os.environ.setdefault(var, default)
+
         tracer_provider = register(
             project_name=project_name,
             auto_instrument=auto_instrument,
+            batch=batch,
         )
 
+        # Flush any queued spans on interpreter exit so batching never
+        # drops the tail of a session.
+        if hasattr(tracer_provider, "force_flush"):
+            atexit.register(tracer_provider.force_flush)
+
         _initialized = True
 
-        endpoint = os.getenv("PHOENIX_COLLECTOR_ENDPOINT", "not set")
         logger.info(
             f"Phoenix telemetry initialized: project={project_name}, "
             f"endpoint={endpoint}, auto_instrument={auto_instrument}"
@@ -0,0 +1,13 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    """Point XDG_CACHE_HOME at a temp dir.
+
+    Framework caches (skill metadata pickles, script result caches) must
+    not litter the real user cache directory during test runs.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
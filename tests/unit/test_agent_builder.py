@@ -83,6 +83,20 @@ class TestRegisterTool:
         assert builder.tool_registry.has_tool("tool3")
 
 
+class TestSkillListing:
+    """Tests for the cached skill listing."""
+
+    def test_listing_contains_all_skills(self, builder: AgentBuilder) -> None:
+        """Listing includes every discovered skill and its description."""
+        listing = builder.skill_listing
+        for name, meta in builder.skill_meta_tool.skills_metadata.items():
+            assert f"- {name}: {meta.description}" in listing
+
+    def test_listing_is_cached(self, builder: AgentBuilder) -> None:
+        """Repeated access returns the same precomputed string."""
+        assert builder.skill_listing is builder.skill_listing
+
+
 class TestBuildSystemPrompt:
     """Tests for system prompt construction."""
 
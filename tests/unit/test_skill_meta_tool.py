@@ -84,6 +84,21 @@ class TestSkillMetaTool:
         # Full content NOT in cache (progressive disclosure)
         assert "hello-world" not in meta_tool._skill_cache
 
+    def test_match_skill_finds_keyword_match(self, meta_tool: SkillMetaTool):
+        """Input overlapping a skill's description keywords matches it."""
+        matched = meta_tool.match_skill(
+            "a simple test skill that greets the user", threshold=0.3
+        )
+        assert matched == "hello-world"
+
+    def test_match_skill_no_match_below_threshold(self, meta_tool: SkillMetaTool):
+        """Unrelated input returns None."""
+        assert meta_tool.match_skill("completely unrelated topic") is None
+
+    def test_match_skill_empty_input(self, meta_tool: SkillMetaTool):
+        """Empty input returns None."""
+        assert meta_tool.match_skill("") is None
+
     def test_get_tool_definition(self, meta_tool: SkillMetaTool):
         """Test tool definition for LLM tools array."""
         tool_def = meta_tool.get_tool_definition()